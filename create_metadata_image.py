@@ -4,9 +4,17 @@ Script to create a test image with embedded EXIF metadata.
 This will help test the metadata extraction functionality.
 """
 
-from PIL import Image, ImageDraw
-from PIL.ExifTags import TAGS, GPSTAGS
+from PIL import Image, ImageDraw, ImageFont
 import os
+import sys
+
+_DONE_MESSAGE = (
+    "✅ Created metadata_test.jpg with embedded EXIF metadata:\n"
+    "   - GPS: 40.7128°, -74.0060° (New York City)\n"
+    "   - Date: 2024:08:14 12:00:00\n"
+    "   - Camera: Test Camera\n"
+    "\n🎯 Upload it to check that GPS, date and camera model are extracted.\n"
+)
 
 def create_test_image_with_metadata():
     """Create a test image with embedded EXIF metadata."""
@@ -17,25 +25,25 @@ def create_test_image_with_metadata():
     
     # Draw some content
     draw.rectangle([50, 50, 350, 250], fill='white', outline='black', width=2)
-    draw.text((100, 100), 'Test Image with Metadata', fill='black')
-    draw.text((100, 130), 'GPS: 40.7128, -74.0060', fill='blue')
-    draw.text((100, 160), 'Date: 2024-08-14', fill='green')
-    draw.text((100, 190), 'Camera: Test Camera', fill='red')
-    
-    # Save the image
-    img.save('metadata_test.jpg', 'JPEG', quality=95)
-    print("✅ Created metadata_test.jpg")
-    
-    print("\n📸 To add real EXIF metadata, you need to:")
-    print("1. Take photos with your phone (GPS enabled)")
-    print("2. Use a digital camera")
-    print("3. Don't edit photos before uploading")
-    print("4. Upload original files, not screenshots")
+    font = ImageFont.load_default()
+    draw.text((100, 100), 'Test Image with Metadata', fill='black', font=font)
+    draw.text((100, 130), 'GPS: 40.7128, -74.0060', fill='blue', font=font)
+    draw.text((100, 160), 'Date: 2024-08-14', fill='green', font=font)
+    draw.text((100, 190), 'Camera: Test Camera', fill='red', font=font)
     
-    print("\n🎯 Your test.jpg already has metadata:")
-    print("   - GPS: -22.951879°, -43.210207° (Rio de Janeiro)")
-    print("   - Date: 2011-12-13 18:59:25")
-    print("   - Camera: Canon EOS 50D")
+    # Build EXIF block (camera, date and GPS matching the drawn text)
+    exif = Image.Exif()
+    exif[0x0110] = 'Test Camera'  # Model
+    exif[0x0132] = '2024:08:14 12:00:00'  # DateTime
+    exif[0x8825] = {  # GPSInfo
+        1: 'N', 2: (40.0, 42.0, 46.08),
+        3: 'W', 4: (74.0, 0.0, 21.6),
+    }
+
+    # Save the image with EXIF embedded in a single encode
+    img.save('metadata_test.jpg', 'JPEG', quality=85, optimize=False, exif=exif)
+    sys.stdout.write(_DONE_MESSAGE)
+
 
 if __name__ == "__main__":
     create_test_image_with_metadata()
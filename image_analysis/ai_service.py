@@ -1,13 +1,247 @@
 import base64
+import hashlib
+import io
 import logging
-import uuid
-from typing import Dict, Any, Optional
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from django.conf import settings
+from django.core.cache import cache
+import orjson
 from openai import OpenAI
 from .models import Article
 
 logger = logging.getLogger(__name__)
 
+_BASE64_CHUNK_SIZE = 57 * 1024
+
+# Masked-text translations are deterministic, so reuse them for a day
+_TRANSLATION_CACHE_TTL = 86400
+
+# Common OCR errors and gibberish patterns, fused into one alternation so
+# the text is scanned once
+_GIBBERISH_RE = re.compile(
+    r'\b[a-z]{1,2}\b'  # Single or double letter fragments
+    r'|\b[a-z]{15,}\b'  # Very long nonsense words
+    r'|\b[a-z]*[0-9]+[a-z]*\b'  # Mixed alphanumeric nonsense
+    r'|\b[a-z]*[!@#$%^&*()]+[a-z]*\b',  # Mixed with symbols
+    re.IGNORECASE,
+)
+
+# English words that signal language mixing in Tamil output
+_ENGLISH_WORDS = [
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'as',
+    'like', 'against', 'fading', 'blush', 'day', 'whispers', 'across', 'horizon', 'cityscape',
+    'glimmers', 'jeweled', 'tapestry',
+]
+_ENGLISH_WORD_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _ENGLISH_WORDS)) + r')\b',
+    re.IGNORECASE,
+)
+
+# Fallback object lists picked from caption keywords when the model lists none
+_CAPTION_OBJECT_BUCKETS = [
+    (re.compile(r'dusk|twilight', re.IGNORECASE), ("sky", "twilight", "atmosphere", "lighting", "mood")),
+    (re.compile(r'branch|tree', re.IGNORECASE), ("tree", "branch", "nature", "outdoors", "landscape")),
+    (re.compile(r'city', re.IGNORECASE), ("city", "buildings", "urban", "architecture", "skyline")),
+]
+
+# Common English to Tamil translations used when the AI translator fails
+_BASIC_TRANSLATIONS = {
+    'the': '', 'a': '', 'an': '', 'and': 'மற்றும்', 'or': 'அல்லது',
+    'but': 'ஆனால்', 'in': 'இல்', 'on': 'மேல்', 'at': 'இல்',
+    'to': 'க்கு', 'for': 'க்காக', 'of': 'ஆன', 'with': 'உடன்',
+    'by': 'மூலம்', 'as': 'போல', 'like': 'போன்ற', 'against': 'எதிராக',
+    'twilight': 'அந்தி நேரம்', 'horizon': 'அடிவானம்', 'cityscape': 'நகரக் காட்சி',
+    'glimmers': 'மின்னுகிறது', 'jeweled': 'நவரத்தின', 'tapestry': 'துணி',
+    'fading': 'மங்கும்', 'blush': 'சிவப்பு', 'day': 'பகல்',
+    'whispers': 'மெதுவாக பரவுகிறது', 'across': 'முழுவதும்',
+    'city': 'நகரம்', 'buildings': 'கட்டிடங்கள்', 'lights': 'விளக்குகள்',
+    'sky': 'வானம்', 'clouds': 'மேகங்கள்', 'trees': 'மரங்கள்',
+    'grass': 'புல்', 'water': 'நீர்', 'mountains': 'மலைகள்',
+    'road': 'சாலை', 'car': 'கார்', 'people': 'மக்கள்',
+    'sun': 'சூரியன்', 'moon': 'சந்திரன்', 'stars': 'நட்சத்திரங்கள்'
+}
+_BASIC_TRANSLATION_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, sorted(_BASIC_TRANSLATIONS, key=len, reverse=True))) + r')\b',
+    re.IGNORECASE,
+)
+
+# Key scene words swapped into an English caption for the Tamil fallback article
+_TAMIL_CAPTION_TERMS = {
+    'twilight': 'அந்தி நேரம்',
+    'horizon': 'அடிவானம்',
+    'city': 'நகரம்',
+    'lights': 'விளக்குகள்',
+    'buildings': 'கட்டிடங்கள்',
+    'trees': 'மரங்கள்',
+    'clouds': 'மேகங்கள்',
+    'sky': 'வானம்',
+    'sunset': 'சூரிய அஸ்தமனம்',
+}
+_TAMIL_CAPTION_RE = re.compile('|'.join(map(re.escape, sorted(_TAMIL_CAPTION_TERMS, key=len, reverse=True))))
+
+# Patterns for proper nouns
+_PROPER_NOUN_RE = re.compile(
+    r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b'  # Capitalized words (e.g., "New York")
+    r'|\b[A-Z]{2,}\b'  # All caps (e.g., "USA", "NASA")
+    r'|\b\d+[A-Za-z]+\b'  # Numbers + letters (e.g., "iPhone 14")
+    r'|\b[A-Za-z]+\d+\b'  # Letters + numbers (e.g., "Windows 11")
+)
+
+
+# Prompts are built once at import time; only the per-request values are
+# formatted in
+_ANALYZE_PROMPT = """
+IMPORTANT: Analyze ONLY what you can actually see in this image. Do NOT make up or imagine content that is not visible.
+
+Look carefully at the image and provide:
+
+1. A POETIC and evocative caption (1-2 sentences) that captures the mood, atmosphere, and essence of what you see
+2. A list of ALL visible objects, people, animals, buildings, or items you can identify
+3. Any text that is visible in the image (OCR)
+
+CAPTION REQUIREMENTS - Make it POETIC and ARTISTIC:
+- Write in a lyrical, poetic style
+- Use vivid, descriptive language and imagery
+- Capture the emotional tone and atmosphere
+- Make it engaging and evocative
+- Focus on visual beauty, colors, light, and composition
+- Use metaphors and artistic descriptions when appropriate
+- Keep it grounded in what you actually see
+
+EXAMPLES of poetic style:
+- "Golden hour paints the cityscape in warm amber hues, where shadows dance between skyscrapers"
+- "A solitary tree stands sentinel against the vast expanse of rolling hills"
+- "Morning mist weaves through ancient stone, whispering secrets of centuries past"
+- "Sunlight filters through leaves, creating a mosaic of light and shadow on the forest floor"
+
+CRITICAL RULES:
+- Base your poetic description ONLY on what is actually visible
+- Do NOT invent fictional elements or contexts
+- Use artistic language to describe REAL visual elements
+- If you cannot clearly see something, say "unclear" or "not visible"
+- Be specific about colors, shapes, light, and visible elements
+
+Please format your response as:
+Caption: [your poetic caption here]
+Objects: [list only visible objects]
+OCR Text: [any visible text, or "No text visible" if none]
+"""
+
+_ARTICLE_PROMPT_TEMPLATE = """
+SYSTEM:
+You are a careful nonfiction writer. Write ONLY in {target_language}.
+Use ONLY the details in INPUT. Do NOT invent places, people, events, brands, or dates.
+If something is missing, omit it. No external facts or web knowledge.
+
+Style rules:
+- Observational, vivid, and specific—but factual.
+- Do NOT copy the caption verbatim; do not reuse more than 6 consecutive words from it.
+- Weave in 2–4 concrete visual elements from Objects/Attributes naturally.
+- Smooth narrative paragraphs (no lists, no headings inside body).
+- Tone: reportage  (e.g., reportage | travelogue | diary)
+- Target length: 100–150 words total.
+
+Place guard:
+If {place_confidence} < 0.8 or Place is empty → do NOT mention a location name or local facts.
+
+Language rules:
+- Keep the entire output in {target_language}.
+- If {target_language} == "ta" (Tamil), translate any English descriptive text into Tamil;
+  keep proper nouns in their original script (optionally add a Tamil transliteration once).
+
+OUTPUT_SCHEMA (return ONLY valid JSON exactly like this):
+{{
+  "title": "string (4–8 words)",
+  "subtitle": "string (10–15 words, 1 sentence)",
+  "body": "string (2–4 paragraphs; plain prose; **bold**/*italic* allowed)",
+  "image_caption": "string (1–2 sentences, 15–30 words; describe only visible elements)",
+  "alt_text": "string (20–40 words; purely descriptive for accessibility)",
+  "tags": ["string", "string", "string"]   // 3–5 grounded tags
+}}
+
+USER:
+Write an article that respects all rules above.
+
+INPUT:
+- Visual caption: {img_caption}
+- Objects: {objects}
+- Attributes: {attributes}
+- OCR text: {ocr_text}
+- Place: {place} (confidence: {place_confidence})
+- Local time: {local_time}
+- Season: {season}
+- User context (optional): {merged_notes_transcript}
+
+Additional constraints:
+- If User context is provided, prioritize those facts; otherwise stay purely observational.
+- Avoid clichés and repetition; vary sentence openings.
+- Tags must come from Objects/Attributes/clearly visible details.
+Return ONLY the JSON specified in OUTPUT_SCHEMA.
+"""
+
+_TRANSLATE_PROMPT_TEMPLATE = """
+SYSTEM:
+You are a deterministic translator. Translate English → Tamil.
+Rules:
+- Do NOT add, remove, or embellish information.
+- Keep only proper nouns in English; everything else must be Tamil.
+- Leave any masked tokens exactly as-is (format: §§PN0§§, §§PN1§§ …).
+- Return plain Tamil text only.
+
+USER:
+Translate this to Tamil, preserving masks:
+{masked_text}
+"""
+
+_BATCH_TRANSLATE_PROMPT_TEMPLATE = """
+SYSTEM:
+You are a deterministic translator. Translate English → Tamil.
+Rules:
+- Do NOT add, remove, or embellish information.
+- Keep only proper nouns in English; everything else must be Tamil.
+- Leave any masked tokens exactly as-is (format: §§PN0§§, §§PN1§§ …).
+- Return JSON: {{"translations": [...]}} with one Tamil string per input, in the same order.
+
+USER:
+Translate each string in this JSON array to Tamil, preserving masks:
+{texts_json}
+"""
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key):
+    """Return a shared OpenAI client so its connection pool survives across requests."""
+    return OpenAI(api_key=api_key)
+
+
+_CROCKFORD_BASE32 = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+
+
+def _new_article_id():
+    """
+    Generate a ULID-style article ID.
+    
+    48 bits of millisecond timestamp followed by 80 random bits, encoded as 26
+    Crockford base32 characters. IDs sort by creation time, so inserts land at
+    the end of the article_id index instead of at random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    chars = []
+    for _ in range(26):
+        value, remainder = divmod(value, 32)
+        chars.append(_CROCKFORD_BASE32[remainder])
+    return ''.join(reversed(chars))
+
+
+def _translation_cache_key(masked_text):
+    """Cache key for a Tamil translation of masked text."""
+    return f"translate:ta:{hashlib.md5(masked_text.encode()).hexdigest()}"
+
 
 class AIService:
     """Service class for AI image analysis using OpenAI GPT-4o."""
@@ -21,8 +255,9 @@ class AIService:
             logger.error("OPENAI_MODEL not configured in settings")
             raise ValueError("OpenAI model not configured")
         
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = _get_client(settings.OPENAI_API_KEY)
         self.model = settings.OPENAI_MODEL
+        self.max_concurrency = max(1, getattr(settings, 'AI_MAX_CONCURRENCY', 8))
         logger.info(f"AIService initialized with model: {self.model}")
     
     def encode_image_to_base64(self, image_path):
@@ -30,14 +265,43 @@ class AIService:
         Encode image to base64 string.
         
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or the image's raw bytes
             
         Returns:
             str: Base64 encoded image string
         """
+        return self._encode_base64_into(bytearray(), image_path).decode('ascii')
+    
+    def encode_image_to_data_uri(self, image_path, mime_type='image/jpeg'):
+        """
+        Encode image as a base64 data URI for the vision API.
+        
+        The base64 text is written straight after the URI prefix, so the
+        (multi-megabyte) encoding is not copied again to build the URI.
+        
+        Args:
+            image_path: Path to the image file, or the image's raw bytes
+            mime_type: MIME type to declare in the URI
+            
+        Returns:
+            str: data:<mime_type>;base64,... URI
+        """
+        prefix = bytearray(f"data:{mime_type};base64,".encode('ascii'))
+        return self._encode_base64_into(prefix, image_path).decode('ascii')
+    
+    def _encode_base64_into(self, encoded, image_path):
+        """Append the base64 encoding of an image (path or raw bytes) to encoded and return it."""
         try:
+            if isinstance(image_path, (bytes, bytearray)):
+                encoded += base64.b64encode(image_path)
+                return encoded
+            
+            # Encode in 57 KB blocks (a multiple of 3, so no padding between
+            # chunks) instead of holding the raw file and its encoding at once
             with open(image_path, "rb") as image_file:
-                return base64.b64encode(image_file.read()).decode('utf-8')
+                while chunk := image_file.read(_BASE64_CHUNK_SIZE):
+                    encoded += base64.b64encode(chunk)
+            return encoded
         except Exception as e:
             logger.error(f"Error encoding image to base64: {e}")
             raise
@@ -47,55 +311,20 @@ class AIService:
         Analyze image using OpenAI GPT-4o Vision API.
         
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or the image's raw bytes
             
         Returns:
             dict: Analysis results containing caption, objects, and OCR text
         """
         try:
-            logger.info(f"Starting image analysis for: {image_path}")
-            
-            # Encode image to base64
-            base64_image = self.encode_image_to_base64(image_path)
-            logger.info(f"Image encoded to base64, length: {len(base64_image)}")
-            
-            # Prepare the prompt for the AI model
-            prompt = """
-            IMPORTANT: Analyze ONLY what you can actually see in this image. Do NOT make up or imagine content that is not visible.
-            
-            Look carefully at the image and provide:
-            
-            1. A POETIC and evocative caption (1-2 sentences) that captures the mood, atmosphere, and essence of what you see
-            2. A list of ALL visible objects, people, animals, buildings, or items you can identify
-            3. Any text that is visible in the image (OCR)
-            
-            CAPTION REQUIREMENTS - Make it POETIC and ARTISTIC:
-            - Write in a lyrical, poetic style
-            - Use vivid, descriptive language and imagery
-            - Capture the emotional tone and atmosphere
-            - Make it engaging and evocative
-            - Focus on visual beauty, colors, light, and composition
-            - Use metaphors and artistic descriptions when appropriate
-            - Keep it grounded in what you actually see
-            
-            EXAMPLES of poetic style:
-            - "Golden hour paints the cityscape in warm amber hues, where shadows dance between skyscrapers"
-            - "A solitary tree stands sentinel against the vast expanse of rolling hills"
-            - "Morning mist weaves through ancient stone, whispering secrets of centuries past"
-            - "Sunlight filters through leaves, creating a mosaic of light and shadow on the forest floor"
-            
-            CRITICAL RULES:
-            - Base your poetic description ONLY on what is actually visible
-            - Do NOT invent fictional elements or contexts
-            - Use artistic language to describe REAL visual elements
-            - If you cannot clearly see something, say "unclear" or "not visible"
-            - Be specific about colors, shapes, light, and visible elements
-            
-            Please format your response as:
-            Caption: [your poetic caption here]
-            Objects: [list only visible objects]
-            OCR Text: [any visible text, or "No text visible" if none]
-            """
+            if isinstance(image_path, (bytes, bytearray)):
+                logger.info(f"Starting image analysis for {len(image_path)} bytes of image data")
+            else:
+                logger.info(f"Starting image analysis for: {image_path}")
+            
+            # Encode image to a base64 data URI
+            image_data_uri = self.encode_image_to_data_uri(image_path)
+            logger.info(f"Image encoded to base64, length: {len(image_data_uri)}")
             
             # Call OpenAI API
             logger.info(f"Calling OpenAI API with model: {self.model}")
@@ -106,11 +335,11 @@ class AIService:
                         {
                             "role": "user",
                             "content": [
-                                {"type": "text", "text": prompt},
+                                {"type": "text", "text": _ANALYZE_PROMPT},
                                 {
                                     "type": "image_url",
                                     "image_url": {
-                                        "url": f"data:image/jpeg;base64,{base64_image}"
+                                        "url": image_data_uri
                                     }
                                 }
                             ]
@@ -129,40 +358,32 @@ class AIService:
             # Parse the response
             ai_response = response.choices[0].message.content
             
-            # Extract information from AI response
-            caption = ""
-            objects = []
-            ocr_text = ""
-            
             # Log the raw AI response for debugging
-            logger.info(f"Raw AI response: {ai_response}")
-            
-            lines = ai_response.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('Caption:'):
-                    caption = line.replace('Caption:', '').strip()
-                elif line.startswith('Objects:'):
-                    objects_str = line.replace('Objects:', '').strip()
-                    objects = [obj.strip() for obj in objects_str.split(',') if obj.strip()]
-                elif line.startswith('OCR Text:'):
-                    ocr_text = line.replace('OCR Text:', '').strip()
-                    if ocr_text == "No text visible":
-                        ocr_text = ""
+            logger.debug("Raw AI response: %s", ai_response)
+            
+            # Extract information from AI response: split each "Key: value"
+            # line once and look the key up
+            fields = {}
+            for line in ai_response.splitlines():
+                key, sep, value = line.partition(':')
+                if sep:
+                    fields[key.strip()] = value.strip()
+            
+            caption = fields.get('Caption', '')
+            objects = [obj.strip() for obj in fields.get('Objects', '').split(',') if obj.strip()]
+            ocr_text = fields.get('OCR Text', '')
+            if ocr_text == "No text visible":
+                ocr_text = ""
             
             # Ensure we have at least some content, but be more specific
             if not caption or caption == "Image analysis completed":
                 caption = "Unable to generate specific caption - image content unclear"
             if not objects or objects == ["image"] or objects == ["content unclear"]:
                 # Generate descriptive objects based on the caption
-                if "dusk" in caption.lower() or "twilight" in caption.lower():
-                    objects = ["sky", "twilight", "atmosphere", "lighting", "mood"]
-                elif "branch" in caption.lower() or "tree" in caption.lower():
-                    objects = ["tree", "branch", "nature", "outdoors", "landscape"]
-                elif "cityscape" in caption.lower() or "city" in caption.lower():
-                    objects = ["city", "buildings", "urban", "architecture", "skyline"]
-                else:
-                    objects = ["visual elements", "composition", "atmosphere", "mood", "scene"]
+                objects = next(
+                    (list(bucket) for pattern, bucket in _CAPTION_OBJECT_BUCKETS if pattern.search(caption)),
+                    ["visual elements", "composition", "atmosphere", "mood", "scene"]
+                )
             if not ocr_text:
                 ocr_text = ""
             
@@ -172,13 +393,158 @@ class AIService:
                 'ocr_text': ocr_text
             }
             
-            logger.info(f"Parsed AI result: {result}")
+            logger.debug("Parsed AI result: %s", result)
             return result
             
         except Exception as e:
             logger.error(f"Error analyzing image with AI: {e}")
             raise
     
+    def analyze_images_bulk(self, image_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze several images concurrently.
+        
+        The OpenAI calls are network-bound, so they are issued from a bounded
+        thread pool (AI_MAX_CONCURRENCY) instead of one after another.
+        
+        Args:
+            image_paths: Paths to the image files
+            
+        Returns:
+            list: Analysis results in the same order as image_paths
+        """
+        if not image_paths:
+            return []
+        
+        workers = min(self.max_concurrency, len(image_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.analyze_image, image_paths))
+    
+    def generate_articles_bulk(self, jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]], target_language: str = 'en') -> List[Dict[str, Any]]:
+        """
+        Generate articles for several analyzed images concurrently.
+        
+        Args:
+            jobs: List of (image_analysis, exif_data) tuples
+            target_language: Language code ('en' for English, 'ta' for Tamil)
+            
+        Returns:
+            list: Article dicts in the same order as jobs
+        """
+        if not jobs:
+            return []
+        
+        workers = min(self.max_concurrency, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.generate_article, image_analysis, exif_data, target_language)
+                for image_analysis, exif_data in jobs
+            ]
+            return [future.result() for future in futures]
+    
+    def submit_article_batch(self, jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]], target_language: str = 'en') -> str:
+        """
+        Submit article generation for several images to the OpenAI Batch API.
+        
+        Batch requests are billed at half price and do not count against the
+        per-minute rate limits, which suits backfills that don't need an
+        interactive response.
+        
+        Args:
+            jobs: List of (image_analysis, exif_data) tuples
+            target_language: Language code ('en' for English, 'ta' for Tamil)
+            
+        Returns:
+            str: OpenAI batch ID
+        """
+        lines = []
+        for idx, (image_analysis, exif_data) in enumerate(jobs):
+            sanitized_analysis = self._sanitize_input_data(image_analysis, target_language)
+            lines.append(orjson.dumps({
+                "custom_id": str(idx),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_article_request(sanitized_analysis, exif_data, target_language),
+            }))
+        
+        payload = io.BytesIO(b'\n'.join(lines))
+        batch_file = self.client.files.create(file=("articles.jsonl", payload), purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        
+        logger.info(f"Submitted article batch {batch.id} with {len(jobs)} requests")
+        return batch.id
+    
+    def fetch_article_batch(self, batch_id: str, job_count: int) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """
+        Fetch the results of a batch submitted with submit_article_batch().
+        
+        Args:
+            batch_id: OpenAI batch ID
+            job_count: Number of jobs in the batch
+            
+        Returns:
+            list: Article dicts in job order (None for failed requests), or
+                None if the batch has not finished yet
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in ('failed', 'expired', 'cancelled'):
+            raise Exception(f"Article batch {batch_id} ended with status {batch.status}")
+        if batch.status != 'completed':
+            return None
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * job_count
+        if not batch.output_file_id:
+            return results
+        
+        output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get('response') or {}
+            if response.get('status_code') != 200:
+                logger.error(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            try:
+                content = response['body']['choices'][0]['message']['content']
+                results[int(record['custom_id'])] = self._fill_missing_article_fields(orjson.loads(content))
+            except (KeyError, IndexError, ValueError) as e:
+                logger.error(f"Failed to parse batch result {record.get('custom_id')}: {e}")
+        
+        return results
+    
+    def generate_articles_batched(self, jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]], target_language: str = 'en', poll_interval: float = 10.0, max_poll_interval: float = 300.0) -> List[Optional[Dict[str, Any]]]:
+        """
+        Generate articles through the Batch API and wait for the results.
+        
+        This blocks until the batch completes, so call it from a management
+        command or background worker rather than a request thread.
+        
+        Args:
+            jobs: List of (image_analysis, exif_data) tuples
+            target_language: Language code ('en' for English, 'ta' for Tamil)
+            poll_interval: Initial seconds between status checks
+            max_poll_interval: Upper bound for the exponential backoff
+            
+        Returns:
+            list: Article dicts in job order (None for failed requests)
+        """
+        if not jobs:
+            return []
+        
+        batch_id = self.submit_article_batch(jobs, target_language)
+        delay = poll_interval
+        while True:
+            results = self.fetch_article_batch(batch_id, len(jobs))
+            if results is not None:
+                return results
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+    
     def generate_article(self, image_analysis, exif_data, target_language='en', retry_count=0):
         """
         Generate a comprehensive multilingual article from image analysis and EXIF data.
@@ -198,87 +564,10 @@ class AIService:
             
             # Use sanitized data for article generation
             image_analysis = sanitized_analysis
-            # Prepare context information
-            location_context = ""
-            if exif_data.get('gps_decimal'):
-                lat = exif_data['gps_decimal']['lat']
-                lon = exif_data['gps_decimal']['lon']
-                location_context = f"Location: {lat}°{'N' if lat >= 0 else 'S'}, {lon}°{'E' if lon >= 0 else 'W'}"
-            
-            time_context = ""
-            if exif_data.get('DateTime'):
-                time_context = f"Date: {exif_data['DateTime']}"
-            
-            camera_context = ""
-            if exif_data.get('Model'):
-                camera_context = f"Camera: {exif_data['Model']}"
-            
-            # Language consistency is now handled in the main prompt
-            
-            # Build the prompt with new structured constraints
-            prompt = f"""
-            SYSTEM:
-            You are a careful nonfiction writer. Write ONLY in {target_language}.
-            Use ONLY the details in INPUT. Do NOT invent places, people, events, brands, or dates.
-            If something is missing, omit it. No external facts or web knowledge.
-
-            Style rules:
-            - Observational, vivid, and specific—but factual.
-            - Do NOT copy the caption verbatim; do not reuse more than 6 consecutive words from it.
-            - Weave in 2–4 concrete visual elements from Objects/Attributes naturally.
-            - Smooth narrative paragraphs (no lists, no headings inside body).
-            - Tone: reportage  (e.g., reportage | travelogue | diary)
-            - Target length: 100–150 words total.
-
-            Place guard:
-            If {image_analysis.get('place_confidence', 0.0)} < 0.8 or Place is empty → do NOT mention a location name or local facts.
-
-            Language rules:
-            - Keep the entire output in {target_language}.
-            - If {target_language} == "ta" (Tamil), translate any English descriptive text into Tamil;
-              keep proper nouns in their original script (optionally add a Tamil transliteration once).
-
-            OUTPUT_SCHEMA (return ONLY valid JSON exactly like this):
-            {{
-              "title": "string (4–8 words)",
-              "subtitle": "string (10–15 words, 1 sentence)",
-              "body": "string (2–4 paragraphs; plain prose; **bold**/*italic* allowed)",
-              "image_caption": "string (1–2 sentences, 15–30 words; describe only visible elements)",
-              "alt_text": "string (20–40 words; purely descriptive for accessibility)",
-              "tags": ["string", "string", "string"]   // 3–5 grounded tags
-            }}
-
-            USER:
-            Write an article that respects all rules above.
-
-            INPUT:
-            - Visual caption: {image_analysis.get('img_caption', 'N/A')}
-            - Objects: {image_analysis.get('objects', [])}
-            - Attributes: {image_analysis.get('attributes', [])}
-            - OCR text: {image_analysis.get('ocr_text', 'N/A')}
-            - Place: {image_analysis.get('place', 'N/A')} (confidence: {image_analysis.get('place_confidence', 0.0)})
-            - Local time: {image_analysis.get('local_time', 'N/A')}
-            - Season: {image_analysis.get('season', 'N/A')}
-            - User context (optional): {image_analysis.get('merged_notes_transcript', 'N/A')}
-
-            Additional constraints:
-            - If User context is provided, prioritize those facts; otherwise stay purely observational.
-            - Avoid clichés and repetition; vary sentence openings.
-            - Tags must come from Objects/Attributes/clearly visible details.
-            Return ONLY the JSON specified in OUTPUT_SCHEMA.
-            """
             
             # Call OpenAI API
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=4000,  # Increased for longer articles
-                temperature=0.7
+                **self._build_article_request(image_analysis, exif_data, target_language)
             )
             
             # Get the response
@@ -286,30 +575,18 @@ class AIService:
             
             # Parse the JSON response
             try:
-                import json
-                article_data = json.loads(article_json)
+                article_data = orjson.loads(article_json)
                 
                 # Validate required fields
-                required_fields = ['title', 'subtitle', 'body', 'image_caption', 'alt_text', 'tags']
-                for field in required_fields:
-                    if field not in article_data:
-                        logger.warning(f"Missing required field: {field}")
-                        if field == 'tags':
-                            article_data[field] = []
-                        elif field == 'body':
-                            article_data[field] = "Content generation failed."
-                        else:
-                            article_data[field] = f"Missing {field}"
+                self._fill_missing_article_fields(article_data)
                 
                 # Language validation - ensure consistency
                 if target_language == 'ta':
                     # Check if any field contains English content
-                    english_words = ['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'as', 'like', 'against', 'fading', 'blush', 'day', 'whispers', 'across', 'horizon', 'cityscape', 'glimmers', 'jeweled', 'tapestry']
                     for field_name, field_value in article_data.items():
                         if isinstance(field_value, str):
                             # Check for English words
-                            field_lower = field_value.lower()
-                            if any(word in field_lower for word in english_words):
+                            if _ENGLISH_WORD_RE.search(field_value):
                                 logger.warning(f"Field {field_name} contains English content: {field_value}")
                                 # Force regeneration in Tamil
                                 if retry_count < 2:  # Allow up to 2 retries
@@ -320,7 +597,7 @@ class AIService:
                         elif isinstance(field_value, list):
                             # Check tags for English
                             for tag in field_value:
-                                if isinstance(tag, str) and any(word in tag.lower() for word in english_words):
+                                if isinstance(tag, str) and _ENGLISH_WORD_RE.search(tag):
                                     logger.warning(f"Tags contain English content: {tag}")
                                     if retry_count < 2:  # Allow up to 2 retries
                                         logger.info(f"Retrying article generation (attempt {retry_count + 1})")
@@ -328,10 +605,10 @@ class AIService:
                                     else:
                                         raise Exception("Language mixing detected in tags after {retry_count} retries")
                 
-                logger.info(f"Generated article successfully in {target_language}: {article_data}")
+                logger.debug("Generated article successfully in %s: %s", target_language, article_data)
                 return article_data
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse JSON response: {e}")
                 logger.error(f"Raw response: {article_json}")
                 
@@ -341,15 +618,7 @@ class AIService:
                     tamil_caption = image_analysis.get('img_caption', 'வர்ணிக்கப்பட்ட காட்சி')
                     if tamil_caption and not any(word in ['வர்ணிக்கப்பட்ட', 'காட்சி', 'படம்', 'இந்த', 'ஒரு'] for word in tamil_caption.lower().split()):
                         # If caption is in English, translate key concepts to Tamil
-                        tamil_caption = (tamil_caption.replace('twilight', 'அந்தி நேரம்')
-                                                   .replace('horizon', 'அடிவானம்')
-                                                   .replace('city', 'நகரம்')
-                                                   .replace('lights', 'விளக்குகள்')
-                                                   .replace('buildings', 'கட்டிடங்கள்')
-                                                   .replace('trees', 'மரங்கள்')
-                                                   .replace('clouds', 'மேகங்கள்')
-                                                   .replace('sky', 'வானம்')
-                                                   .replace('sunset', 'சூரிய அஸ்தமனம்'))
+                        tamil_caption = _TAMIL_CAPTION_RE.sub(lambda m: _TAMIL_CAPTION_TERMS[m.group(0)], tamil_caption)
                     
                     return {
                         'title': 'பட பகுப்பாய்வு கட்டுரை',
@@ -381,46 +650,96 @@ This image displays a scene. It captures the scene. It provides the scene.""",
             logger.error(f"Error generating article: {e}")
             raise
     
+    def _build_article_request(self, image_analysis, exif_data, target_language):
+        """
+        Build the chat completion payload used for article generation.
+        
+        Shared by generate_article() and the Batch API path so both send
+        exactly the same request.
+        
+        Args:
+            image_analysis: Sanitized analysis dict
+            exif_data: Dict containing GPS, datetime, camera_model
+            target_language: Language code ('en' for English, 'ta' for Tamil)
+            
+        Returns:
+            dict: Keyword arguments for chat.completions.create
+        """
+        # Build the prompt with new structured constraints
+        prompt = _ARTICLE_PROMPT_TEMPLATE.format(
+            target_language=target_language,
+            place_confidence=image_analysis.get('place_confidence', 0.0),
+            img_caption=image_analysis.get('img_caption', 'N/A'),
+            objects=image_analysis.get('objects', []),
+            attributes=image_analysis.get('attributes', []),
+            ocr_text=image_analysis.get('ocr_text', 'N/A'),
+            place=image_analysis.get('place', 'N/A'),
+            local_time=image_analysis.get('local_time', 'N/A'),
+            season=image_analysis.get('season', 'N/A'),
+            merged_notes_transcript=image_analysis.get('merged_notes_transcript', 'N/A'),
+        )
+        
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": 4000,  # Increased for longer articles
+            "temperature": 0.7,
+            # JSON mode guarantees parseable output instead of prose-wrapped JSON
+            "response_format": {"type": "json_object"}
+        }
+    
+    def _fill_missing_article_fields(self, article_data):
+        """
+        Default any required article fields the model left out (in place).
+        """
+        required_fields = ['title', 'subtitle', 'body', 'image_caption', 'alt_text', 'tags']
+        for field in required_fields:
+            if field not in article_data:
+                logger.warning(f"Missing required field: {field}")
+                if field == 'tags':
+                    article_data[field] = []
+                elif field == 'body':
+                    article_data[field] = "Content generation failed."
+                else:
+                    article_data[field] = f"Missing {field}"
+        return article_data
+    
     def _sanitize_input_data(self, image_analysis, target_language):
         """
         Pre-process input data to prevent language mixing and clean OCR errors.
         Translates descriptive English content to Tamil while preserving proper nouns.
+        Non-Tamil input is returned unchanged (callers must not mutate it).
         """
-        sanitized = image_analysis.copy()
+        if target_language != 'ta':
+            return image_analysis
         
-        if target_language == 'ta':
-            # Clean and translate English captions to Tamil
-            caption = sanitized.get('img_caption', '')
-            if caption:
-                # Remove gibberish and nonsensical fragments
-                caption = self._clean_gibberish(caption)
-                
-                # Translate descriptive English words while preserving proper nouns
-                caption = self._translate_to_tamil_preserving_proper_nouns(caption)
-                
-                if caption.strip():
-                    sanitized['img_caption'] = caption
-                else:
-                    sanitized['img_caption'] = 'காட்சி விளக்கம்'
-            
-            # Clean and translate OCR text
-            ocr_text = sanitized.get('ocr_text', '')
-            if ocr_text:
-                ocr_text = self._clean_gibberish(ocr_text)
-                ocr_text = self._translate_to_tamil_preserving_proper_nouns(ocr_text)
-                sanitized['ocr_text'] = ocr_text
-            
-            # Translate English objects to Tamil
-            objects = sanitized.get('objects', [])
-            if objects:
-                tamil_objects = []
-                for obj in objects:
-                    if isinstance(obj, str):
-                        tamil_obj = self._translate_to_tamil_preserving_proper_nouns(obj)
-                        tamil_objects.append(tamil_obj)
-                    else:
-                        tamil_objects.append(obj)
-                sanitized['objects'] = tamil_objects
+        # Client JSON may carry nulls here; only non-empty strings are translated
+        caption = image_analysis.get('img_caption')
+        caption = caption if isinstance(caption, str) else ''
+        ocr_text = image_analysis.get('ocr_text')
+        ocr_text = ocr_text if isinstance(ocr_text, str) else ''
+        objects = image_analysis.get('objects') or []
+        
+        # Remove gibberish, then translate caption, OCR text and objects in
+        # one batched call, preserving proper nouns
+        texts = [self._clean_gibberish(caption), self._clean_gibberish(ocr_text)]
+        texts.extend(obj for obj in objects if isinstance(obj, str))
+        translated = iter(self._translate_many_to_tamil_preserving_proper_nouns(texts))
+        tamil_caption, tamil_ocr_text = next(translated), next(translated)
+        
+        # Only overwrite keys that were present and non-empty
+        sanitized = image_analysis.copy()
+        if caption:
+            sanitized['img_caption'] = tamil_caption if tamil_caption.strip() else 'காட்சி விளக்கம்'
+        if ocr_text:
+            sanitized['ocr_text'] = tamil_ocr_text
+        if objects:
+            sanitized['objects'] = [next(translated) if isinstance(obj, str) else obj for obj in objects]
         
         return sanitized
     
@@ -431,23 +750,10 @@ This image displays a scene. It captures the scene. It provides the scene.""",
         if not text:
             return text
         
-        # Common OCR errors and gibberish patterns
-        gibberish_patterns = [
-            r'\b[a-z]{1,2}\b',  # Single or double letter fragments
-            r'\b[a-z]{15,}\b',  # Very long nonsense words
-            r'\b[a-z]*[0-9]+[a-z]*\b',  # Mixed alphanumeric nonsense
-            r'\b[a-z]*[!@#$%^&*()]+[a-z]*\b',  # Mixed with symbols
-        ]
-        
-        import re
-        cleaned_text = text
-        
-        for pattern in gibberish_patterns:
-            cleaned_text = re.sub(pattern, '', cleaned_text, flags=re.IGNORECASE)
+        cleaned_text = _GIBBERISH_RE.sub('', text)
         
         # Remove extra spaces and clean up
-        cleaned_text = ' '.join(cleaned_text.split())
-        return cleaned_text.strip()
+        return ' '.join(cleaned_text.split())
     
     def _translate_to_tamil_preserving_proper_nouns(self, text):
         """
@@ -468,54 +774,58 @@ This image displays a scene. It captures the scene. It provides the scene.""",
         
         return final_text
     
+    def _translate_many_to_tamil_preserving_proper_nouns(self, texts: List[str]) -> List[str]:
+        """
+        Batched form of _translate_to_tamil_preserving_proper_nouns().
+        
+        Empty strings are passed through without an API call.
+        """
+        results = list(texts)
+        pending = [idx for idx, text in enumerate(texts) if text]
+        masked = {idx: self._mask_proper_nouns(texts[idx]) for idx in pending}
+        
+        tamil_texts = self._ai_translate_masked_texts([masked[idx][0] for idx in pending])
+        for idx, tamil_text in zip(pending, tamil_texts):
+            results[idx] = self._restore_proper_nouns(tamil_text, masked[idx][1])
+        
+        return results
+    
     def _mask_proper_nouns(self, text):
         """
         Identify and mask proper nouns in English text.
         Returns (masked_text, proper_nouns_dict)
         """
-        import re
-        
-        # Patterns for proper nouns
-        proper_noun_patterns = [
-            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b',  # Capitalized words (e.g., "New York")
-            r'\b[A-Z]{2,}\b',  # All caps (e.g., "USA", "NASA")
-            r'\b\d+[A-Za-z]+\b',  # Numbers + letters (e.g., "iPhone 14")
-            r'\b[A-Za-z]+\d+\b',  # Letters + numbers (e.g., "Windows 11")
-        ]
-        
-        masked_text = text
         proper_nouns = {}
-        mask_counter = 0
+        masks_by_noun = {}
         
-        for pattern in proper_noun_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                proper_noun = match.group()
-                mask = f"§§PN{mask_counter}§§"
+        def mask_match(match):
+            proper_noun = match.group()
+            mask = masks_by_noun.get(proper_noun)
+            if mask is None:
+                mask = f"§§PN{len(proper_nouns)}§§"
+                masks_by_noun[proper_noun] = mask
                 proper_nouns[mask] = proper_noun
-                masked_text = masked_text.replace(proper_noun, mask)
-                mask_counter += 1
+            return mask
+        
+        # Single pass over the text; repeated nouns share one mask
+        masked_text = _PROPER_NOUN_RE.sub(mask_match, text)
         
         return masked_text, proper_nouns
     
     def _ai_translate_masked_text(self, masked_text):
         """
         Use AI to translate masked English text to Tamil.
+        
+        Successful translations are cached, since the same object names and
+        phrases ("sky", "tree", ...) recur across images.
         """
+        cache_key = _translation_cache_key(masked_text)
+        cached_result = cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+        
         try:
-            prompt = f"""
-            SYSTEM:
-            You are a deterministic translator. Translate English → Tamil.
-            Rules:
-            - Do NOT add, remove, or embellish information.
-            - Keep only proper nouns in English; everything else must be Tamil.
-            - Leave any masked tokens exactly as-is (format: §§PN0§§, §§PN1§§ …).
-            - Return plain Tamil text only.
-
-            USER:
-            Translate this to Tamil, preserving masks:
-            {masked_text}
-            """
+            prompt = _TRANSLATE_PROMPT_TEMPLATE.format(masked_text=masked_text)
             
             response = self.client.chat.completions.create(
                 model=self.model,
@@ -529,43 +839,73 @@ This image displays a scene. It captures the scene. It provides the scene.""",
                 temperature=0.1  # Low temperature for deterministic translation
             )
             
-            return response.choices[0].message.content.strip()
+            translated = response.choices[0].message.content.strip()
+            cache.set(cache_key, translated, _TRANSLATION_CACHE_TTL)
+            return translated
             
         except Exception as e:
             logger.error(f"AI translation failed: {e}")
             # Fallback: basic word replacement
             return self._basic_english_to_tamil_fallback(masked_text)
     
-    def _basic_english_to_tamil_fallback(self, text):
+    def _ai_translate_masked_texts(self, masked_texts: List[str]) -> List[str]:
         """
-        Basic fallback translation if AI fails.
+        Translate several masked strings to Tamil with a single API call.
+        
+        Cached strings are skipped; the rest are sent as one JSON array. If the
+        batched call fails or returns the wrong number of items, each string
+        falls back to _ai_translate_masked_text().
         """
-        # Common English to Tamil translations
-        basic_translations = {
-            'the': '', 'a': '', 'an': '', 'and': 'மற்றும்', 'or': 'அல்லது',
-            'but': 'ஆனால்', 'in': 'இல்', 'on': 'மேல்', 'at': 'இல்',
-            'to': 'க்கு', 'for': 'க்காக', 'of': 'ஆன', 'with': 'உடன்',
-            'by': 'மூலம்', 'as': 'போல', 'like': 'போன்ற', 'against': 'எதிராக',
-            'twilight': 'அந்தி நேரம்', 'horizon': 'அடிவானம்', 'cityscape': 'நகரக் காட்சி',
-            'glimmers': 'மின்னுகிறது', 'jeweled': 'நவரத்தின', 'tapestry': 'துணி',
-            'fading': 'மங்கும்', 'blush': 'சிவப்பு', 'day': 'பகல்',
-            'whispers': 'மெதுவாக பரவுகிறது', 'across': 'முழுவதும்',
-            'city': 'நகரம்', 'buildings': 'கட்டிடங்கள்', 'lights': 'விளக்குகள்',
-            'sky': 'வானம்', 'clouds': 'மேகங்கள்', 'trees': 'மரங்கள்',
-            'grass': 'புல்', 'water': 'நீர்', 'mountains': 'மலைகள்',
-            'road': 'சாலை', 'car': 'கார்', 'people': 'மக்கள்',
-            'sun': 'சூரியன்', 'moon': 'சந்திரன்', 'stars': 'நட்சத்திரங்கள்'
-        }
+        cache_keys = [_translation_cache_key(text) for text in masked_texts]
+        cached = cache.get_many(cache_keys) if cache_keys else {}
+        results = [cached.get(key) for key in cache_keys]
+        missing = [idx for idx, result in enumerate(results) if result is None]
         
-        # Simple word replacement
-        result = text
-        for english, tamil in basic_translations.items():
-            result = result.replace(f' {english} ', f' {tamil} ')
-            result = result.replace(f'{english} ', f'{tamil} ')
-            result = result.replace(f' {english}', f' {tamil}')
-            result = result.replace(english, tamil)
+        if len(missing) == 1:
+            results[missing[0]] = self._ai_translate_masked_text(masked_texts[missing[0]])
+        elif missing:
+            try:
+                prompt = _BATCH_TRANSLATE_PROMPT_TEMPLATE.format(
+                    texts_json=orjson.dumps([masked_texts[idx] for idx in missing]).decode()
+                )
+                
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    max_tokens=4000,
+                    temperature=0.1,  # Low temperature for deterministic translation
+                    response_format={"type": "json_object"}
+                )
+                
+                translations = orjson.loads(response.choices[0].message.content).get('translations')
+                if not isinstance(translations, list) or len(translations) != len(missing):
+                    raise ValueError(f"expected {len(missing)} translations, got {translations!r}")
+                
+                for idx, translated in zip(missing, translations):
+                    results[idx] = str(translated).strip()
+                cache.set_many({cache_keys[idx]: results[idx] for idx in missing}, _TRANSLATION_CACHE_TTL)
+                
+            except Exception as e:
+                logger.error(f"Batched AI translation failed, translating individually: {e}")
+                workers = min(self.max_concurrency, len(missing))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    translations = executor.map(self._ai_translate_masked_text, [masked_texts[idx] for idx in missing])
+                    for idx, translated in zip(missing, translations):
+                        results[idx] = translated
         
-        return result
+        return results
+    
+    def _basic_english_to_tamil_fallback(self, text):
+        """
+        Basic fallback translation if AI fails.
+        """
+        # Single pass: each whole word is looked up in the translation table
+        return _BASIC_TRANSLATION_RE.sub(lambda m: _BASIC_TRANSLATIONS[m.group(0).lower()], text)
     
     def _restore_proper_nouns(self, tamil_text, proper_nouns):
         """
@@ -592,41 +932,84 @@ This image displays a scene. It captures the scene. It provides the scene.""",
         Returns:
             str: Article ID
         """
+        return self.save_articles_bulk([{
+            'article_data': article_data,
+            'image_analysis': image_analysis,
+            'exif_data': exif_data,
+            'target_language': target_language,
+            'image_url': image_url,
+        }])[0]
+    
+    def save_articles_bulk(self, rows: List[Dict[str, Any]], batch_size: int = 500) -> List[str]:
+        """
+        Save several generated articles with batched INSERTs.
+        
+        Args:
+            rows: Dicts with the keyword arguments of save_article()
+                (article_data, image_analysis, exif_data, target_language,
+                and optionally image_url and article_id)
+            batch_size: Maximum rows per INSERT statement
+            
+        Returns:
+            list: Article IDs in the same order as rows
+        """
         try:
-            # Generate unique article ID
-            article_id = str(uuid.uuid4())
-            
-            # Create article object
-            article = Article(
-                article_id=article_id,
-                title=article_data.get('title', ''),
-                subtitle=article_data.get('subtitle', ''),
-                body=article_data.get('body', ''),
-                image_caption=article_data.get('image_caption', ''),
-                alt_text=article_data.get('alt_text', ''),
-                tags=article_data.get('tags', []),
-                language=target_language,
-                target_language=target_language,
-                image_url=image_url or '',  # Save the actual image URL
-                image_alt=article_data.get('alt_text', ''),
-                img_caption=image_analysis.get('img_caption', ''),
-                detected_objects=image_analysis.get('objects', []),
-                attributes=image_analysis.get('attributes', []),
-                ocr_text=image_analysis.get('ocr_text', ''),
-                place=image_analysis.get('place', ''),
-                place_confidence=image_analysis.get('place_confidence', 0.0),
-                local_time=image_analysis.get('local_time', ''),
-                season=image_analysis.get('season', ''),
-                merged_notes_transcript=image_analysis.get('merged_notes_transcript', ''),
-                exif_data=exif_data
-            )
+            articles = [
+                self._build_article(
+                    row['article_data'], row['image_analysis'], row['exif_data'], row['target_language'],
+                    row.get('image_url'), row.get('article_id') or _new_article_id()
+                )
+                for row in rows
+            ]
             
             # Save to database
-            article.save()
+            Article.objects.bulk_create(articles, batch_size=batch_size)
             
-            logger.info(f"Article saved successfully with ID: {article_id}")
-            return article_id
+            article_ids = [article.article_id for article in articles]
+            logger.info(f"Saved {len(article_ids)} article(s) successfully: {article_ids}")
+            return article_ids
             
         except Exception as e:
             logger.error(f"Failed to save article: {e}")
             raise
+    
+    def _build_article(self, article_data, image_analysis, exif_data, target_language, image_url, article_id):
+        """
+        Build an unsaved Article instance from generated data.
+        """
+        return Article(
+            article_id=article_id,
+            title=article_data.get('title', ''),
+            subtitle=article_data.get('subtitle', ''),
+            body=article_data.get('body', ''),
+            image_caption=article_data.get('image_caption', ''),
+            alt_text=article_data.get('alt_text', ''),
+            tags=article_data.get('tags', []),
+            language=target_language,
+            target_language=target_language,
+            image_url=image_url or '',  # Save the actual image URL
+            image_alt=article_data.get('alt_text', ''),
+            img_caption=image_analysis.get('img_caption', ''),
+            detected_objects=image_analysis.get('objects', []),
+            attributes=image_analysis.get('attributes', []),
+            ocr_text=image_analysis.get('ocr_text', ''),
+            place=image_analysis.get('place', ''),
+            place_confidence=image_analysis.get('place_confidence', 0.0),
+            local_time=image_analysis.get('local_time', ''),
+            season=image_analysis.get('season', ''),
+            merged_notes_transcript=image_analysis.get('merged_notes_transcript', ''),
+            exif_data=exif_data
+        )
+
+
+@lru_cache(maxsize=1)
+def get_ai_service():
+    """
+    Return the shared AIService instance.
+    
+    AIService holds no per-request state, so views reuse one instance (and
+    its pooled OpenAI client) instead of constructing and logging a new one
+    per request. A configuration error is raised again on every call, since
+    lru_cache does not cache exceptions.
+    """
+    return AIService()
@@ -3,6 +3,7 @@ Stories API endpoints for creating and managing day stories
 """
 import json
 import logging
+import uuid
 from datetime import datetime, date
 from typing import List, Dict, Any
 from rest_framework import status
@@ -14,6 +15,7 @@ from django.db import transaction
 from django.contrib.auth.models import User
 
 from ..models import Story, StoryItem, Media, ImageAnalysis
+from ..serializers import StoryCreateSerializer
 from ..services.story_input import build_story_input
 from ..services.writer_prompts import generate_story
 
@@ -30,42 +32,20 @@ class StoriesView(APIView):
         Create a new story from multiple media items
         """
         try:
-            # Extract request data
-            media_ids = request.data.get('media_ids', [])
-            lang = request.data.get('lang', 'en')
-            tone = request.data.get('tone', 'diary')
-            length = request.data.get('length', 'medium')
-            place_override = request.data.get('place_override')
-            
-            # Validate required fields
-            if not media_ids:
-                return Response(
-                    {'error': 'media_ids is required'}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Validate choices
-            valid_langs = ['en', 'ta']
-            valid_tones = ['reportage', 'travelogue', 'diary']
-            valid_lengths = ['short', 'medium', 'long']
-            
-            if lang not in valid_langs:
-                return Response(
-                    {'error': f'Invalid lang. Must be one of: {valid_langs}'}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            if tone not in valid_tones:
+            # Validate request data
+            serializer = StoryCreateSerializer(data=request.data)
+            if not serializer.is_valid():
                 return Response(
-                    {'error': f'Invalid tone. Must be one of: {valid_tones}'}, 
+                    {'error': 'Invalid input', 'details': serializer.errors}, 
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            if length not in valid_lengths:
-                return Response(
-                    {'error': f'Invalid length. Must be one of: {valid_lengths}'}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+            data = serializer.validated_data
+            media_ids = data['media_ids']
+            lang = data['lang']
+            tone = data['tone']
+            length = data['length']
+            place_override = data.get('place_override')
             
             # Fetch media and analysis data
             media_list = self._fetch_media_with_analysis(media_ids, request.user)
@@ -105,50 +85,66 @@ class StoriesView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
-    def _fetch_media_with_analysis(self, media_ids: List[str], user: User) -> List[Dict[str, Any]]:
+    def _fetch_media_with_analysis(self, media_ids: List[uuid.UUID], user: User) -> List[Dict[str, Any]]:
         """
-        Fetch media items with their analysis data
+        Fetch media items with their analysis data in a single query
+        
+        media_ids have already been parsed as UUIDs by StoryCreateSerializer.
         """
-        media_list = []
+        missing_ids = []
+        
+        # Only load the columns used to build the media items below; results
+        # are re-ordered by request, so skip the default ORDER BY
+        queryset = Media.objects.filter(id__in=media_ids, user=user).select_related('analysis').only(
+            'id', 'image', 'original_filename', 'exif_datetime', 'uploaded_at',
+            'analysis__img_caption', 'analysis__detected_objects', 'analysis__attributes',
+            'analysis__ocr_text', 'analysis__place', 'analysis__place_confidence',
+            'analysis__local_time', 'analysis__season', 'analysis__user_notes',
+            'analysis__merged_notes_transcript',
+        ).order_by()
+        medias = {media.id: media for media in queryset}
         
+        # Preserve the client-supplied order
+        media_list = []
         for media_id in media_ids:
+            media = medias.get(media_id)
+            if media is None:
+                missing_ids.append(str(media_id))
+                continue
+            
+            # Get analysis if it exists (already joined)
             try:
-                # Get media item
-                media = get_object_or_404(Media, id=media_id, user=user)
-                
-                # Get analysis if it exists
-                try:
-                    analysis = ImageAnalysis.objects.get(media=media)
-                    analysis_data = {
-                        'img_caption': analysis.img_caption,
-                        'detected_objects': analysis.detected_objects,
-                        'attributes': analysis.attributes,
-                        'ocr_text': analysis.ocr_text,
-                        'place': analysis.place,
-                        'place_confidence': analysis.place_confidence,
-                        'local_time': analysis.local_time,
-                        'season': analysis.season,
-                        'user_notes': analysis.user_notes,
-                        'merged_notes_transcript': analysis.merged_notes_transcript,
-                    }
-                except ImageAnalysis.DoesNotExist:
-                    analysis_data = {}
-                
-                # Build media item with analysis
-                media_item = {
-                    'id': str(media.id),
-                    'image_url': media.image.url if media.image else '',
-                    'alt_text': media.original_filename,
-                    'exif_datetime': media.exif_datetime,
-                    'uploaded_at': media.uploaded_at,
-                    'analysis': analysis_data
+                analysis = media.analysis
+                analysis_data = {
+                    'img_caption': analysis.img_caption,
+                    'detected_objects': analysis.detected_objects,
+                    'attributes': analysis.attributes,
+                    'ocr_text': analysis.ocr_text,
+                    'place': analysis.place,
+                    'place_confidence': analysis.place_confidence,
+                    'local_time': analysis.local_time,
+                    'season': analysis.season,
+                    'user_notes': analysis.user_notes,
+                    'merged_notes_transcript': analysis.merged_notes_transcript,
                 }
-                
-                media_list.append(media_item)
-                
-            except Exception as e:
-                logger.warning(f"Failed to fetch media {media_id}: {e}")
-                continue
+            except ImageAnalysis.DoesNotExist:
+                analysis_data = {}
+            
+            # Build media item with analysis
+            media_item = {
+                'id': str(media.id),
+                'media': media,  # Loaded instance, reused when creating story items
+                'image_url': media.image.url if media.image else '',
+                'alt_text': media.original_filename,
+                'exif_datetime': media.exif_datetime,
+                'uploaded_at': media.uploaded_at,
+                'analysis': analysis_data
+            }
+            
+            media_list.append(media_item)
+        
+        if missing_ids:
+            logger.warning(f"Failed to fetch media {missing_ids}")
         
         return media_list
     
@@ -166,16 +162,15 @@ class StoriesView(APIView):
             }
         
         # Find the media item with highest place confidence
-        best_place = None
-        best_confidence = 0.0
-        
-        for media_item in media_list:
-            analysis = media_item.get('analysis', {})
-            confidence = analysis.get('place_confidence', 0.0)
-            
-            if confidence > best_confidence and analysis.get('place'):
-                best_confidence = confidence
-                best_place = analysis.get('place')
+        best_confidence, best_place = max(
+            (
+                (analysis.get('place_confidence', 0.0), analysis['place'])
+                for analysis in (media_item.get('analysis', {}) for media_item in media_list)
+                if analysis.get('place')
+            ),
+            key=lambda candidate: candidate[0],
+            default=(0.0, None)
+        )
         
         if best_place and best_confidence > 0.0:
             return {
@@ -221,23 +216,25 @@ class StoriesView(APIView):
     
     def _create_story_items(self, story: Story, media_list: List[Dict[str, Any]], story_input: Dict[str, Any]):
         """
-        Create StoryItem objects for each media item
+        Create StoryItem objects for each media item in a single INSERT
         """
+        photos_by_media_id = {p['media_id']: p for p in story_input['photos']}
+        
+        story_items = []
         for idx, media_item in enumerate(media_list):
             # Find corresponding photo data from story input
-            photo_data = next(
-                (p for p in story_input['photos'] if p['media_id'] == media_item['id']), 
-                None
-            )
+            photo_data = photos_by_media_id.get(media_item['id'])
             
             if photo_data:
-                StoryItem.objects.create(
+                story_items.append(StoryItem(
                     story=story,
-                    media_id=media_item['id'],
+                    media=media_item['media'],
                     order_idx=idx,
                     local_time=photo_data.get('local_time', ''),
                     daypart=photo_data.get('daypart', '')
-                )
+                ))
+        
+        StoryItem.objects.bulk_create(story_items, batch_size=500)
 
 class StoryDetailView(APIView):
     """
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:32
+
+import image_analysis.models
+from django.db import migrations, models
+
+
+def backfill_share_tokens(apps, schema_editor):
+    Story = apps.get_model('image_analysis', 'Story')
+    stories = list(Story.objects.filter(share_token__isnull=True).only('id'))
+    for story in stories:
+        story.share_token = image_analysis.models.generate_share_token()
+    Story.objects.bulk_update(stories, ['share_token'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('image_analysis', '0003_media_imageanalysis_story_storyitem'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='story',
+            name='share_token',
+            field=models.CharField(blank=True, default=image_analysis.models.generate_share_token, max_length=100, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_share_tokens, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('image_analysis', '0004_alter_story_share_token'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='story',
+            index=models.Index(fields=['user', '-created_at'], name='stories_user_id_b336dc_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('image_analysis', '0005_story_stories_user_id_b336dc_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='article',
+            name='title',
+            field=models.CharField(db_index=True, max_length=200),
+        ),
+    ]
@@ -63,6 +63,10 @@ class ImageAnalysis(models.Model):
     def __str__(self):
         return f"Analysis for {self.media.original_filename}"
 
+def generate_share_token():
+    """Default share token for new stories"""
+    return uuid.uuid4().hex
+
 class Story(models.Model):
     """A day story combining multiple photos"""
     
@@ -100,20 +104,18 @@ class Story(models.Model):
     # Timestamps and sharing
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    share_token = models.CharField(max_length=100, null=True, blank=True, unique=True)
+    share_token = models.CharField(max_length=100, null=True, blank=True, unique=True, default=generate_share_token)
     is_public = models.BooleanField(default=False)
     
     class Meta:
         db_table = 'stories'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
     
     def __str__(self):
         return f"Story {self.id} - {self.story_date or 'Unknown Date'}"
-    
-    def save(self, *args, **kwargs):
-        if not self.share_token:
-            self.share_token = str(uuid.uuid4())
-        super().save(*args, **kwargs)
 
 class StoryItem(models.Model):
     """Individual photos within a story, ordered by time"""
@@ -217,7 +219,7 @@ class Article(models.Model):
     article_id = models.CharField(max_length=255, unique=True, db_index=True)
     
     # Article content
-    title = models.CharField(max_length=200)
+    title = models.CharField(max_length=200, db_index=True)
     subtitle = models.CharField(max_length=300, blank=True)
     body = models.TextField()
     image_caption = models.CharField(max_length=500, blank=True)
@@ -262,6 +264,12 @@ class Article(models.Model):
     def __str__(self):
         return f"{self.title} ({self.get_language_display()})"
     
+    # Columns read by to_pdf_data(); PDF lookups load only these
+    PDF_FIELDS = (
+        'article_id', 'title', 'subtitle', 'body', 'image_url', 'image_alt',
+        'image_caption', 'tags', 'language', 'created_at',
+    )
+    
     @property
     def share_url(self):
         """Generate share URL for the article"""
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import StoryPlace
+from .models import Story, StoryPlace
 
 
 class ImageUploadSerializer(serializers.Serializer):
@@ -107,3 +107,11 @@ class LocationResponseSerializer(serializers.Serializer):
     country_code = serializers.CharField()
     confidence = serializers.FloatField()
     source = serializers.CharField()
+
+class StoryCreateSerializer(serializers.Serializer):
+    """Serializer for story creation requests"""
+    media_ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+    lang = serializers.ChoiceField(choices=Story.LANGUAGE_CHOICES, default='en')
+    tone = serializers.ChoiceField(choices=Story.TONE_CHOICES, default='diary')
+    length = serializers.ChoiceField(choices=Story.LENGTH_CHOICES, default='medium')
+    place_override = serializers.DictField(required=False, allow_null=True)
@@ -1,13 +1,40 @@
 """
 Daypart services for categorizing photos by time of day
 """
+from bisect import bisect_right
 from datetime import datetime, time
+from functools import lru_cache
 from typing import Optional, Union
 from zoneinfo import ZoneInfo
 import logging
 
+try:
+    from timezonefinder import TimezoneFinder
+except ImportError:
+    TimezoneFinder = None
+
 logger = logging.getLogger(__name__)
 
+# Daypart boundaries in minutes since midnight (05:00, 12:00, 17:00, 21:00)
+# and the label for each interval between them
+_DAYPART_BOUNDS = (5 * 60, 12 * 60, 17 * 60, 21 * 60)
+_DAYPART_LABELS = ('night', 'morning', 'afternoon', 'evening', 'night')
+
+# Natural progression of dayparts through a day
+DAYPART_ORDER = ('morning', 'afternoon', 'evening', 'night')
+
+@lru_cache(maxsize=256)
+def _zone(name: str) -> ZoneInfo:
+    """Return a cached ZoneInfo so tzdata is only resolved once per zone."""
+    return ZoneInfo(name)
+
+_UTC = _zone("UTC")
+
+@lru_cache(maxsize=1)
+def _timezone_finder():
+    """Return a shared TimezoneFinder (loading its polygon data is expensive)."""
+    return TimezoneFinder(in_memory=True)
+
 def bucket_daypart(local_dt: Union[datetime, time]) -> str:
     """
     Bucket a local datetime or time into daypart categories.
@@ -23,22 +50,9 @@ def bucket_daypart(local_dt: Union[datetime, time]) -> str:
     else:
         local_time = local_dt
     
-    # Define daypart boundaries
-    morning_start = time(5, 0)      # 05:00
-    morning_end = time(11, 59)      # 11:59
-    afternoon_start = time(12, 0)   # 12:00
-    afternoon_end = time(16, 59)    # 16:59
-    evening_start = time(17, 0)     # 17:00
-    evening_end = time(20, 59)      # 20:59
-    
-    if morning_start <= local_time <= morning_end:
-        return 'morning'
-    elif afternoon_start <= local_time <= afternoon_end:
-        return 'afternoon'
-    elif evening_start <= local_time <= evening_end:
-        return 'evening'
-    else:
-        return 'night'
+    # Half-open intervals, so e.g. 11:59:30 is still morning
+    minutes = local_time.hour * 60 + local_time.minute
+    return _DAYPART_LABELS[bisect_right(_DAYPART_BOUNDS, minutes)]
 
 def tz_for_place(place_ctx: dict) -> ZoneInfo:
     """
@@ -53,7 +67,7 @@ def tz_for_place(place_ctx: dict) -> ZoneInfo:
     # If timezone is explicitly provided, use it
     if place_ctx.get('timezone'):
         try:
-            return ZoneInfo(place_ctx['timezone'])
+            return _zone(place_ctx['timezone'])
         except Exception:
             logger.warning(f"Unknown timezone: {place_ctx['timezone']}")
     
@@ -62,17 +76,19 @@ def tz_for_place(place_ctx: dict) -> ZoneInfo:
     lon = place_ctx.get('lon')
     
     if lat is not None and lon is not None:
-        try:
-            # Use zoneinfo to get timezone from coordinates
-            tz = ZoneInfo.atlas().get((lat, lon))
-            if tz:
-                return tz
-        except Exception as e:
-            logger.warning(f"Failed to derive timezone from coordinates: {e}")
+        if TimezoneFinder is None:
+            logger.warning("timezonefinder not installed, cannot derive timezone from coordinates")
+        else:
+            try:
+                tz_name = _timezone_finder().timezone_at(lng=lon, lat=lat)
+                if tz_name:
+                    return _zone(tz_name)
+            except Exception as e:
+                logger.warning(f"Failed to derive timezone from coordinates: {e}")
     
     # Fallback to UTC
     logger.info("Using UTC as fallback timezone")
-    return ZoneInfo("UTC")
+    return _UTC
 
 def to_local(utc_dt: datetime, tz: ZoneInfo) -> datetime:
     """
@@ -87,7 +103,7 @@ def to_local(utc_dt: datetime, tz: ZoneInfo) -> datetime:
     """
     if utc_dt.tzinfo is None:
         # Assume UTC if no timezone info
-        utc_dt = utc_dt.replace(tzinfo=ZoneInfo("UTC"))
+        utc_dt = utc_dt.replace(tzinfo=_UTC)
     
     return utc_dt.astimezone(tz)
 
@@ -111,7 +127,7 @@ def get_daypart_from_datetime(dt: datetime, place_ctx: dict) -> tuple[str, str]:
         daypart = bucket_daypart(local_dt)
         
         # Format local time as HH:MM
-        local_time_str = local_dt.strftime('%H:%M')
+        local_time_str = f"{local_dt.hour:02d}:{local_dt.minute:02d}"
         
         return daypart, local_time_str
         
@@ -129,9 +145,7 @@ def get_dayparts_order(dayparts: list[str]) -> list[str]:
     Returns:
         Ordered list of dayparts
     """
-    natural_order = ['morning', 'afternoon', 'evening', 'night']
-    
     # Filter to only include dayparts that are present
-    present_dayparts = [dp for dp in natural_order if dp in dayparts]
+    present_dayparts = [dp for dp in DAYPART_ORDER if dp in dayparts]
     
     return present_dayparts
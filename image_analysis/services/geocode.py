@@ -1,68 +1,111 @@
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
 import hashlib
 import json
-from typing import List, Optional, Dict, Any
+import orjson
+from typing import List, Optional, Dict, Any, Tuple
 from django.conf import settings
 from django.core.cache import cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cached in place of a result when Nominatim found nothing, so repeated
+# misses don't spend the rate limit; kept shorter than positive results
+_NEGATIVE_RESULT = '__MISS__'
+_NEGATIVE_TTL = 3600
+
+# Transient upstream failures retried by _make_request (attempts in total)
+_MAX_ATTEMPTS = 3
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+class LocalTTLCache:
+    """Small thread-safe in-process LRU cache whose entries expire after ttl seconds"""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+@dataclass(slots=True)
 class PlaceCandidate:
     """Represents a geocoding result candidate"""
     
-    def __init__(self, data: Dict[str, Any]):
-        self.label = data.get('display_name', '')
-        self.lat = float(data.get('lat', 0))
-        self.lon = float(data.get('lon', 0))
-        self.place_name = data.get('name', '')
-        self.city = self._extract_city(data)
-        self.admin = self._extract_admin(data)
-        self.country = data.get('address', {}).get('country', '')
-        self.country_code = data.get('address', {}).get('country_code', '').upper()
-        self.provider = 'nominatim'
-        self.provider_place_id = str(data.get('place_id', ''))
-        self.confidence = self._calculate_confidence(data)
-    
-    def _extract_city(self, data: Dict[str, Any]) -> str:
-        """Extract city from address components"""
-        address = data.get('address', {})
-        for key in ['city', 'town', 'village', 'municipality']:
-            if address.get(key):
-                return address[key]
-        return ''
+    label: str = ''
+    lat: float = 0.0
+    lon: float = 0.0
+    place_name: str = ''
+    city: str = ''
+    admin: str = ''
+    country: str = ''
+    country_code: str = ''
+    provider: str = 'nominatim'
+    provider_place_id: str = ''
+    confidence: float = 0.5
+    
+    # Address components checked in order of preference
+    _CITY_KEYS = ('city', 'town', 'village', 'municipality')
+    _ADMIN_KEYS = ('state', 'province', 'region')
     
-    def _extract_admin(self, data: Dict[str, Any]) -> str:
-        """Extract administrative region from address components"""
+    @classmethod
+    def from_nominatim(cls, data: Dict[str, Any]) -> 'PlaceCandidate':
+        """Build a candidate from a raw Nominatim result"""
         address = data.get('address', {})
-        for key in ['state', 'province', 'region']:
-            if address.get(key):
-                return address[key]
-        return ''
+        return cls(
+            label=data.get('display_name', ''),
+            lat=float(data.get('lat', 0)),
+            lon=float(data.get('lon', 0)),
+            place_name=data.get('name', ''),
+            city=next((address[key] for key in cls._CITY_KEYS if address.get(key)), ''),
+            admin=next((address[key] for key in cls._ADMIN_KEYS if address.get(key)), ''),
+            country=address.get('country', ''),
+            country_code=address.get('country_code', '').upper(),
+            provider='nominatim',
+            provider_place_id=str(data.get('place_id', '')),
+            confidence=cls._calculate_confidence(data),
+        )
     
-    def _calculate_confidence(self, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def _calculate_confidence(data: Dict[str, Any]) -> float:
         """Map Nominatim importance to confidence score (0.5 to 0.95)"""
         importance = float(data.get('importance', 0.1))
         # Map importance (0.0 to 1.0) to confidence (0.5 to 0.95)
         confidence = 0.5 + (importance * 0.45)
         return min(0.95, max(0.5, confidence))
     
+    @classmethod
+    def from_cached(cls, data: Dict[str, Any]) -> 'PlaceCandidate':
+        """Rebuild a candidate from its to_dict() form without re-parsing"""
+        return cls(**data)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return {
-            'label': self.label,
-            'lat': self.lat,
-            'lon': self.lon,
-            'place_name': self.place_name,
-            'city': self.city,
-            'admin': self.admin,
-            'country': self.country,
-            'country_code': self.country_code,
-            'provider': self.provider,
-            'provider_place_id': self.provider_place_id,
-            'confidence': self.confidence,
-        }
+        return {name: getattr(self, name) for name in self.__slots__}
 
 class GeoProvider:
     """Base class for geocoding providers"""
@@ -87,37 +130,94 @@ class NominatimProvider(GeoProvider):
         self.user_agent = getattr(settings, 'NOMINATIM_USER_AGENT', 'LifeChronicles/1.0')
         self.email = getattr(settings, 'NOMINATIM_EMAIL', '')
         self.rate_limit_delay = 1.0  # 1 request per second
-        self.last_request_time = 0
+        
+        # Token bucket: idle time accrues request credit up to the burst capacity
+        self._capacity = float(getattr(settings, 'NOMINATIM_BURST', 1))
+        self._refill_rate = 1.0 / self.rate_limit_delay
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        
+        # Per-process layer in front of the shared cache for repeated lookups
+        self._local = LocalTTLCache(maxsize=1024, ttl=300)
+        
+        # Per-key locks so concurrent misses for the same lookup share one request
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Persistent session so TCP/TLS connections are reused across lookups
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = self.user_agent
+        # No adapter-level retries: those would bypass the rate limiter, so
+        # _make_request retries itself and takes a token per attempt
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        self.session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+    
+    def _refill(self):
+        """Add the tokens earned since the last refill, capped at capacity"""
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate)
+        self._last_refill = now
     
     def _rate_limit(self):
-        """Implement rate limiting"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        """Implement rate limiting with a thread-safe token bucket"""
+        with self._rate_lock:
+            self._refill()
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / self._refill_rate)
+                self._refill()
+            self._tokens -= 1
+    
+    @contextmanager
+    def _single_flight(self, key: str):
+        """Hold the lock for key, so only one thread at a time fetches it upstream"""
+        with self._inflight_lock:
+            entry = self._inflight.get(key)
+            if entry is None:
+                entry = self._inflight[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._inflight_lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._inflight[key]
     
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Make HTTP request to Nominatim with rate limiting and error handling"""
-        self._rate_limit()
+        """
+        Make HTTP request to Nominatim with rate limiting and error handling.
         
-        # Add required headers
-        headers = {
-            'User-Agent': self.user_agent
-        }
+        Gateway errors, timeouts and connection errors are retried up to
+        _MAX_ATTEMPTS times in total, each attempt waiting for its own
+        rate-limit token.
         
+        Returns None when the request failed, and an empty list/dict when it
+        succeeded without results.
+        """
         # Add email if configured
         if self.email:
             params['email'] = self.email
         
         try:
-            response = requests.get(
-                f"{self.base_url}/{endpoint}",
-                params=params,
-                headers=headers,
-                timeout=10
-            )
+            for attempt in range(1, _MAX_ATTEMPTS + 1):
+                self._rate_limit()
+                try:
+                    response = self.session.get(
+                        f"{self.base_url}/{endpoint}",
+                        params=params,
+                        timeout=10
+                    )
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    if attempt == _MAX_ATTEMPTS:
+                        raise
+                    logger.warning(f"Nominatim request failed (attempt {attempt}), retrying: {e}")
+                    continue
+                if response.status_code in _RETRY_STATUSES and attempt < _MAX_ATTEMPTS:
+                    logger.warning(f"Nominatim returned {response.status_code} (attempt {attempt}), retrying")
+                    continue
+                break
             
             if response.status_code == 429:
                 # Rate limited - extract retry-after header
@@ -127,17 +227,97 @@ class NominatimProvider(GeoProvider):
                 return None
             
             response.raise_for_status()
-            return response.json()
+            
+            # "No results" bodies are common and need no parsing
+            content = response.content
+            if not content or content in (b'[]', b'{}'):
+                return [] if endpoint == 'search' else {}
+            return orjson.loads(content)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Error making request to Nominatim: {e}")
             return None
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON from Nominatim: {e}")
+            return None
     
     def _get_cache_key(self, operation: str, **kwargs) -> str:
         """Generate cache key for operation"""
-        # Create a hash of the parameters
-        param_str = json.dumps(kwargs, sort_keys=True)
-        return f"geocode:{operation}:{hashlib.md5(param_str.encode()).hexdigest()}"
+        # Fixed-shape keys skip JSON; free text is hashed to stay memcached-safe
+        if operation == 'reverse':
+            return f"geocode:rev:{kwargs['lat']}:{kwargs['lon']}"
+        if operation == 'forward':
+            param_str = f"{kwargs['city'].lower()}|{kwargs['country'].lower()}"
+        elif operation == 'search':
+            # Case and runs of whitespace don't change Nominatim's answer
+            param_str = ' '.join(kwargs['query'].lower().split())
+        else:
+            param_str = json.dumps(kwargs, sort_keys=True)
+        return f"geocode:{operation}:{hashlib.blake2b(param_str.encode(), digest_size=16).hexdigest()}"
+    
+    def _cache_get(self, key: str):
+        """Read from the in-process cache, falling back to the shared cache"""
+        value = self._local.get(key)
+        if value is None:
+            value = self._decode(cache.get(key))
+            if value is not None:
+                self._local.set(key, value)
+        return value
+    
+    def _cache_get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Bulk version of _cache_get; only local misses reach the shared cache"""
+        found = {}
+        remote_keys = []
+        for key in keys:
+            value = self._local.get(key)
+            if value is None:
+                remote_keys.append(key)
+            else:
+                found[key] = value
+        
+        if remote_keys:
+            for key, raw in cache.get_many(remote_keys).items():
+                value = self._decode(raw)
+                self._local.set(key, value)
+                found[key] = value
+        return found
+    
+    def _cache_set(self, key: str, value, timeout: int):
+        """Write to both the in-process and the shared cache"""
+        self._local.set(key, value)
+        cache.set(key, orjson.dumps(value), timeout)
+    
+    def _cache_set_many(self, entries: Dict[str, Any], timeout: int):
+        """Bulk version of _cache_set"""
+        for key, value in entries.items():
+            self._local.set(key, value)
+        cache.set_many({key: orjson.dumps(value) for key, value in entries.items()}, timeout)
+    
+    @staticmethod
+    def _decode(raw):
+        """Decode an orjson payload from the shared cache (older entries may be plain objects)"""
+        if isinstance(raw, (bytes, bytearray)):
+            return orjson.loads(raw)
+        return raw
+    
+    def _place_cache_key(self, provider_place_id: str) -> str:
+        """Cache key for a single place, shared by search/forward/reverse results"""
+        return f"geocode:place:{provider_place_id}"
+    
+    def _place_entries(self, candidates: List[PlaceCandidate]) -> Dict[str, Any]:
+        """Per-place cache entries for candidates that have a provider id"""
+        return {
+            self._place_cache_key(c.provider_place_id): c.to_dict()
+            for c in candidates if c.provider_place_id
+        }
+    
+    def get_place(self, provider_place_id: str) -> Optional[PlaceCandidate]:
+        """Return a previously geocoded place by its provider id, from cache only"""
+        if not provider_place_id:
+            return None
+        
+        cached_result = self._cache_get(self._place_cache_key(provider_place_id))
+        return PlaceCandidate.from_cached(cached_result) if cached_result else None
     
     def search(self, query: str) -> List[PlaceCandidate]:
         """Search for places by query string"""
@@ -148,11 +328,34 @@ class NominatimProvider(GeoProvider):
         cache_key = self._get_cache_key('search', query=query)
         
         # Check cache first
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return [PlaceCandidate(item) for item in cached_result]
+        cached_result = self._cache_get(cache_key)
+        if cached_result is None:
+            with self._single_flight(cache_key):
+                # A concurrent request may have filled the cache while this one waited
+                cached_result = self._cache_get(cache_key)
+                if cached_result is None:
+                    return self._search_and_cache(query, cache_key)
         
-        # Make API request
+        if cached_result == _NEGATIVE_RESULT:
+            return []
+        return [PlaceCandidate.from_cached(item) for item in cached_result]
+    
+    def _search_and_cache(self, query: str, cache_key: str) -> List[PlaceCandidate]:
+        """Search upstream and cache the outcome (negative results included)"""
+        candidates = self._search_request(query)
+        if candidates is None:
+            return []
+        if not candidates:
+            self._cache_set(cache_key, _NEGATIVE_RESULT, _NEGATIVE_TTL)
+            return []
+        
+        # Cache for 24 hours
+        self._cache_set_many({cache_key: [c.to_dict() for c in candidates], **self._place_entries(candidates)}, 86400)
+        
+        return candidates
+    
+    def _search_request(self, query: str) -> Optional[List[PlaceCandidate]]:
+        """Query Nominatim search for up to 5 candidates (no caching); None if the request failed"""
         params = {
             'q': query,
             'format': 'json',
@@ -161,16 +364,52 @@ class NominatimProvider(GeoProvider):
         }
         
         result = self._make_request('search', params)
-        if not result:
-            return []
+        if result is None:
+            return None
         
-        # Convert to PlaceCandidate objects
-        candidates = [PlaceCandidate(item) for item in result]
+        return [PlaceCandidate.from_nominatim(item) for item in result]
+    
+    def search_many(self, queries: List[str]) -> List[List[PlaceCandidate]]:
+        """
+        Search several queries, reading and writing the cache in bulk.
         
-        # Cache for 24 hours
-        cache.set(cache_key, [c.to_dict() for c in candidates], 86400)
+        Args:
+            queries: Query strings; duplicates are only looked up once
+            
+        Returns:
+            Candidate lists in the same order as queries
+        """
+        keys = {}
+        for query in queries:
+            if query and len(query.strip()) <= 120:
+                keys.setdefault(query.strip(), self._get_cache_key('search', query=query.strip()))
         
-        return candidates
+        cached = self._cache_get_many(list(keys.values()))
+        results = {}
+        new_entries = {}
+        misses = {}
+        for query, cache_key in keys.items():
+            cached_result = cached.get(cache_key)
+            if cached_result == _NEGATIVE_RESULT:
+                continue
+            if cached_result:
+                results[query] = [PlaceCandidate.from_cached(item) for item in cached_result]
+                continue
+            
+            candidates = self._search_request(query)
+            if candidates:
+                results[query] = candidates
+                new_entries[cache_key] = [c.to_dict() for c in candidates]
+                new_entries.update(self._place_entries(candidates))
+            elif candidates is not None:
+                misses[cache_key] = _NEGATIVE_RESULT
+        
+        if new_entries:
+            self._cache_set_many(new_entries, 86400)
+        if misses:
+            self._cache_set_many(misses, _NEGATIVE_TTL)
+        
+        return [results.get(query.strip(), []) if query else [] for query in queries]
     
     def reverse(self, lat: float, lon: float) -> Optional[PlaceCandidate]:
         """Reverse geocode coordinates to place"""
@@ -181,10 +420,20 @@ class NominatimProvider(GeoProvider):
         cache_key = self._get_cache_key('reverse', lat=lat_rounded, lon=lon_rounded)
         
         # Check cache first
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return PlaceCandidate(cached_result)
+        cached_result = self._cache_get(cache_key)
+        if cached_result is None:
+            with self._single_flight(cache_key):
+                # A concurrent request may have filled the cache while this one waited
+                cached_result = self._cache_get(cache_key)
+                if cached_result is None:
+                    return self._reverse_and_cache(lat, lon, cache_key)
         
+        if cached_result == _NEGATIVE_RESULT:
+            return None
+        return PlaceCandidate.from_cached(cached_result)
+    
+    def _reverse_and_cache(self, lat: float, lon: float, cache_key: str) -> Optional[PlaceCandidate]:
+        """Reverse geocode upstream and cache the outcome (negative results included)"""
         # Make API request
         params = {
             'lat': lat,
@@ -194,14 +443,18 @@ class NominatimProvider(GeoProvider):
         }
         
         result = self._make_request('reverse', params)
-        if not result:
+        if result is None:
+            return None
+        if not result or 'error' in result:
+            # Nominatim answers {"error": "Unable to geocode"} when nothing is there
+            self._cache_set(cache_key, _NEGATIVE_RESULT, _NEGATIVE_TTL)
             return None
         
         # Convert to PlaceCandidate object
-        candidate = PlaceCandidate(result)
+        candidate = PlaceCandidate.from_nominatim(result)
         
         # Cache for 24 hours
-        cache.set(cache_key, candidate.to_dict(), 86400)
+        self._cache_set_many({cache_key: candidate.to_dict(), **self._place_entries([candidate])}, 86400)
         
         return candidate
     
@@ -210,33 +463,93 @@ class NominatimProvider(GeoProvider):
         if not city or not country:
             return None
         
-        query = f"{city}, {country}"
         cache_key = self._get_cache_key('forward', city=city, country=country)
         
         # Check cache first
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return PlaceCandidate(cached_result)
+        cached_result = self._cache_get(cache_key)
+        if cached_result is None:
+            with self._single_flight(cache_key):
+                # A concurrent request may have filled the cache while this one waited
+                cached_result = self._cache_get(cache_key)
+                if cached_result is None:
+                    return self._forward_and_cache(city, country, cache_key)
         
-        # Make API request
+        if cached_result == _NEGATIVE_RESULT:
+            return None
+        return PlaceCandidate.from_cached(cached_result)
+    
+    def _forward_and_cache(self, city: str, country: str, cache_key: str) -> Optional[PlaceCandidate]:
+        """Forward geocode upstream and cache the outcome (negative results included)"""
+        candidates = self._forward_request(city, country)
+        if candidates is None:
+            return None
+        if not candidates:
+            self._cache_set(cache_key, _NEGATIVE_RESULT, _NEGATIVE_TTL)
+            return None
+        
+        candidate = candidates[0]
+        
+        # Cache for 24 hours
+        self._cache_set_many({cache_key: candidate.to_dict(), **self._place_entries([candidate])}, 86400)
+        
+        return candidate
+    
+    def _forward_request(self, city: str, country: str) -> Optional[List[PlaceCandidate]]:
+        """Query Nominatim for the best match of a city/country pair (no caching); None if the request failed"""
         params = {
-            'q': query,
+            'q': f"{city}, {country}",
             'format': 'json',
             'limit': 1,
             'addressdetails': 1,
         }
         
         result = self._make_request('search', params)
-        if not result or not result:
+        if result is None:
             return None
         
-        # Convert to PlaceCandidate object
-        candidate = PlaceCandidate(result[0])
+        return [PlaceCandidate.from_nominatim(item) for item in result[:1]]
+    
+    def forward_many(self, pairs: List[Tuple[str, str]]) -> List[Optional[PlaceCandidate]]:
+        """
+        Forward geocode several city/country pairs, reading and writing the cache in bulk.
         
-        # Cache for 24 hours
-        cache.set(cache_key, candidate.to_dict(), 86400)
+        Args:
+            pairs: (city, country) tuples; duplicates are only looked up once
+            
+        Returns:
+            Candidates (or None) in the same order as pairs
+        """
+        keys = {}
+        for city, country in pairs:
+            if city and country:
+                keys.setdefault((city, country), self._get_cache_key('forward', city=city, country=country))
         
-        return candidate
+        cached = self._cache_get_many(list(keys.values()))
+        results = {}
+        new_entries = {}
+        misses = {}
+        for (city, country), cache_key in keys.items():
+            cached_result = cached.get(cache_key)
+            if cached_result == _NEGATIVE_RESULT:
+                continue
+            if cached_result:
+                results[(city, country)] = PlaceCandidate.from_cached(cached_result)
+                continue
+            
+            candidates = self._forward_request(city, country)
+            if candidates:
+                results[(city, country)] = candidates[0]
+                new_entries[cache_key] = candidates[0].to_dict()
+                new_entries.update(self._place_entries(candidates))
+            elif candidates is not None:
+                misses[cache_key] = _NEGATIVE_RESULT
+        
+        if new_entries:
+            self._cache_set_many(new_entries, 86400)
+        if misses:
+            self._cache_set_many(misses, _NEGATIVE_TTL)
+        
+        return [results.get(pair) for pair in pairs]
 
 # Default provider instance
 geocoding_provider = NominatimProvider()
@@ -5,9 +5,14 @@ Handles layout, fonts, images, and multilingual support.
 import os
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+
+from PIL import Image as PILImage
 
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -23,6 +28,10 @@ from ..utils.md_to_paragraphs import convert_markdown_to_paragraphs, create_tami
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever layout or styling changes, so cached and client copies
+# of previously rendered PDFs are invalidated
+PDF_BUILDER_VERSION = 1
+
 # Visual constants
 COLORS = {
     'INK': HexColor('#111111'),
@@ -48,6 +57,9 @@ FONTS = {
     'tag': 9,
 }
 
+# Resolution images are resampled to before embedding
+IMAGE_DPI = 150
+
 # Page sizes
 PAGE_SIZES = {
     'letter': letter,
@@ -61,6 +73,52 @@ FONT_PATHS = {
     'NotoSerifTamil': 'static/fonts/NotoSerifTamil-Regular.ttf',
 }
 
+# Image downloads run here so they overlap with building the text flowables
+_IMAGE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='pdf-image')
+
+
+@lru_cache(maxsize=1)
+def _ensure_fonts_registered() -> bool:
+    """Register custom fonts once per process; return whether any were found."""
+    try:
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        
+        # Get app directory
+        app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        
+        fonts_found = False
+        for font_name, relative_path in FONT_PATHS.items():
+            font_path = os.path.join(app_dir, relative_path)
+            if os.path.exists(font_path):
+                pdfmetrics.registerFont(TTFont(font_name, font_path))
+                logger.info(f"{font_name} font registered successfully")
+                fonts_found = True
+            else:
+                logger.warning(f"{font_name} font not found, using fallback")
+        
+        if not fonts_found:
+            logger.warning("No custom fonts found, using system fallbacks")
+        return fonts_found
+        
+    except Exception as e:
+        logger.error(f"Font registration failed: {e}")
+        return False
+
+
+@lru_cache(maxsize=256)
+def _qr_png(url: str) -> bytes:
+    """Render a QR code for url as PNG bytes; raises ImportError without qrcode."""
+    import qrcode
+    qr = qrcode.QRCode(version=1, box_size=10, border=5)
+    qr.add_data(url)
+    qr.make(fit=True)
+    
+    qr_img = qr.make_image(fill_color="black", back_color="white")
+    qr_buffer = BytesIO()
+    qr_img.save(qr_buffer, format='PNG')
+    return qr_buffer.getvalue()
+
 
 class TagChip(Flowable):
     """Custom flowable for rendering tag chips."""
@@ -86,91 +144,63 @@ class PDFBuilder:
     """PDF Builder for generating article PDFs."""
     
     def __init__(self):
-        self.fonts_registered = False
-        self._register_fonts()
+        self.fonts_registered = _ensure_fonts_registered()
+        
+        # (element_type, language family) -> font name, resolved once
+        body_font = 'PlayfairDisplay' if self.fonts_registered else 'Helvetica'
+        tamil_font = 'NotoSerifTamil' if self.fonts_registered else 'Helvetica'
+        self._font_map = {
+            ('title', 'ta'): 'NotoSerifTamil' if self.fonts_registered else 'Helvetica-Bold',
+            ('subtitle', 'ta'): tamil_font,
+            ('body', 'ta'): tamil_font,
+            ('caption', 'ta'): tamil_font,
+            ('default', 'ta'): 'Helvetica',
+            ('title', 'en'): 'PlayfairDisplayBold' if self.fonts_registered else 'Helvetica-Bold',
+            ('default', 'en'): body_font,
+        }
+        
+        # ParagraphStyles keyed by (name, language); see _style()
+        self._style_cache: Dict[Tuple[str, Optional[str]], ParagraphStyle] = {}
+        
+        # Shared session so repeated image downloads reuse pooled connections
+        self._img_session = requests.Session()
+        self._img_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        self._img_session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
     
-    def _register_fonts(self):
-        """Register custom fonts."""
-        try:
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-            
-            # Get app directory
-            from django.conf import settings
-            app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            # Register Playfair Display
-            playfair_path = os.path.join(app_dir, FONT_PATHS['PlayfairDisplay'])
-            if os.path.exists(playfair_path):
-                pdfmetrics.registerFont(TTFont('PlayfairDisplay', playfair_path))
-                logger.info("PlayfairDisplay font registered successfully")
-            else:
-                logger.warning("PlayfairDisplay font not found, using fallback")
-            
-            # Register Playfair Display Bold
-            playfair_bold_path = os.path.join(app_dir, FONT_PATHS['PlayfairDisplayBold'])
-            if os.path.exists(playfair_bold_path):
-                pdfmetrics.registerFont(TTFont('PlayfairDisplayBold', playfair_bold_path))
-                logger.info("PlayfairDisplayBold font registered successfully")
-            else:
-                logger.warning("PlayfairDisplayBold font not found, using fallback")
-            
-            # Register Noto Serif Tamil
-            tamil_path = os.path.join(app_dir, FONT_PATHS['NotoSerifTamil'])
-            if os.path.exists(tamil_path):
-                pdfmetrics.registerFont(TTFont('NotoSerifTamil', tamil_path))
-                logger.info("Noto Serif Tamil font registered successfully")
-            else:
-                logger.warning("Noto Serif Tamil font not found, using fallback")
-            
-            # Only mark as registered if at least some fonts were found
-            if any(os.path.exists(os.path.join(app_dir, path)) for path in FONT_PATHS.values()):
-                self.fonts_registered = True
-            else:
-                self.fonts_registered = False
-                logger.warning("No custom fonts found, using system fallbacks")
-            
-        except Exception as e:
-            logger.error(f"Font registration failed: {e}")
-            self.fonts_registered = False
+    def _style(self, name: str, language: Optional[str] = None, **kwargs) -> ParagraphStyle:
+        """Return a ParagraphStyle built once per (name, language) and reused afterwards."""
+        key = (name, language)
+        style = self._style_cache.get(key)
+        if style is None:
+            style = self._style_cache[key] = ParagraphStyle(name, **kwargs)
+        return style
     
     def _get_font_name(self, element_type: str, language: str) -> str:
         """Get appropriate font name based on element type and language."""
-        if language == 'ta':
-            if element_type == 'title':
-                return 'NotoSerifTamil' if self.fonts_registered else 'Helvetica-Bold'
-            elif element_type in ['subtitle', 'body', 'caption']:
-                return 'NotoSerifTamil' if self.fonts_registered else 'Helvetica'
-            else:
-                return 'Helvetica'
-        else:
-            if element_type == 'title':
-                return 'PlayfairDisplayBold' if self.fonts_registered else 'Helvetica-Bold'
-            elif element_type == 'subtitle':
-                return 'PlayfairDisplay' if self.fonts_registered else 'Helvetica'
-            else:
-                return 'PlayfairDisplay' if self.fonts_registered else 'Helvetica'
+        family = 'ta' if language == 'ta' else 'en'
+        return self._font_map.get((element_type, family)) or self._font_map[('default', family)]
     
-    def _download_image(self, image_url: str, timeout: int = 10) -> Optional[BytesIO]:
-        """Download image from URL or load from local file."""
+    def _download_image(self, image_url: str, timeout: int = 10) -> Optional[Union[str, BytesIO]]:
+        """
+        Download image from URL or resolve a local file.
+        
+        Local files are returned as a path so ReportLab can open them lazily
+        instead of copying the whole file into memory; only network
+        downloads are buffered in a BytesIO.
+        """
         try:
-            # Handle local file paths (direct paths) - check first
-            if os.path.exists(image_url):
+            # Handle local file paths (absolute paths only, so a bare name
+            # never resolves against the server's working directory)
+            if os.path.isabs(image_url) and os.path.exists(image_url):
                 logger.info(f"Loading local file: {image_url}")
-                with open(image_url, 'rb') as f:
-                    image_data = BytesIO(f.read())
-                    image_data.seek(0)
-                    return image_data
+                return image_url
             
             # Handle local file URLs (file:// protocol)
             if image_url.startswith('file://'):
                 file_path = image_url.replace('file://', '')
                 if os.path.exists(file_path):
                     logger.info(f"Loading local file from file:// URL: {file_path}")
-                    with open(file_path, 'rb') as f:
-                        image_data = BytesIO(f.read())
-                        image_data.seek(0)
-                        return image_data
+                    return file_path
                 else:
                     logger.warning(f"Local file not found: {file_path}")
                     return None
@@ -178,7 +208,7 @@ class PDFBuilder:
             # Handle regular HTTP URLs - only if it looks like a URL
             if image_url.startswith(('http://', 'https://')):
                 logger.info(f"Downloading from URL: {image_url}")
-                response = requests.get(image_url, stream=True, timeout=timeout)
+                response = self._img_session.get(image_url, stream=True, timeout=timeout)
                 response.raise_for_status()
 
                 image_data = BytesIO()
@@ -195,6 +225,28 @@ class PDFBuilder:
             logger.error(f"Failed to download/load image {image_url}: {e}")
             return None
     
+    def _downsample_image(self, image_data: Union[str, BytesIO], width: float, height: float) -> Union[str, BytesIO]:
+        """Shrink an image to IMAGE_DPI at its printed size so the PDF doesn't embed full-resolution photos."""
+        try:
+            with PILImage.open(image_data) as im:
+                target_px = (int(width / inch * IMAGE_DPI), int(height / inch * IMAGE_DPI))
+                if im.width <= target_px[0] and im.height <= target_px[1]:
+                    if isinstance(image_data, BytesIO):
+                        image_data.seek(0)
+                    return image_data
+                
+                im.draft('RGB', target_px)  # Let the JPEG decoder skip detail we'd discard
+                im.thumbnail(target_px, PILImage.LANCZOS)
+                output = BytesIO()
+                im.convert('RGB').save(output, 'JPEG', quality=82, optimize=True, progressive=True)
+                output.seek(0)
+                return output
+        except Exception as e:
+            logger.warning(f"Could not downsample image, embedding original: {e}")
+            if isinstance(image_data, BytesIO):
+                image_data.seek(0)
+            return image_data
+    
     def _create_header(self, canvas_obj, article: Dict, page_width: float, margin: float):
         """Create the header with brand, dateline, and section."""
         y_position = page_width - margin - 20
@@ -229,8 +281,8 @@ class PDFBuilder:
         
         # Title
         title_font = self._get_font_name('title', language)
-        title_style = ParagraphStyle(
-            'CustomTitle',
+        title_style = self._style(
+            'CustomTitle', language,
             fontName=title_font,
             fontSize=FONTS['title'],
             alignment=TA_CENTER,
@@ -244,8 +296,8 @@ class PDFBuilder:
         
         # Subtitle
         subtitle_font = self._get_font_name('subtitle', language)
-        subtitle_style = ParagraphStyle(
-            'CustomSubtitle',
+        subtitle_style = self._style(
+            'CustomSubtitle', language,
             fontName=subtitle_font,
             fontSize=FONTS['subtitle'],
             alignment=TA_CENTER,
@@ -296,7 +348,7 @@ class PDFBuilder:
             return elements
         
         # Tags label
-        label_style = ParagraphStyle(
+        label_style = self._style(
             'TagsLabel',
             fontName='Helvetica',
             fontSize=FONTS['tag'],
@@ -329,32 +381,25 @@ class PDFBuilder:
         elements.append(Spacer(1, SPACING['gap_large']))
         return elements
     
-    def _create_image_and_caption(self, story, article: Dict, language: str, margin: float, page_width: float, page_height: float):
-        """Create image and caption at the bottom."""
+    def _create_image_and_caption(self, story, article: Dict, language: str, margin: float, page_width: float, page_height: float, image_data: Optional[Union[str, BytesIO]] = None):
+        """Create image and caption at the bottom from already-loaded image data."""
         elements = []
         
-        # Image
-        image_url = article.get('image_url')
-        image_data = None
-        
-        if image_url:
-            image_data = self._download_image(image_url)
-        
         if image_data:
             try:
                 # Calculate image dimensions
                 img_width = page_width - (2 * margin)
                 img_height = img_width * 0.75  # Approximate aspect ratio
                 
-                # Create image
-                img = Image(image_data, width=img_width, height=img_height)
+                # Create image from a copy resampled to the printed size
+                img = Image(self._downsample_image(image_data, img_width, img_height), width=img_width, height=img_height)
                 img.hAlign = 'CENTER'
                 elements.append(img)
                 
                 # Caption
                 caption_font = self._get_font_name('caption', language)
-                caption_style = ParagraphStyle(
-                    'Caption',
+                caption_style = self._style(
+                    'Caption', language,
                     fontName=caption_font,
                     fontSize=FONTS['caption'],
                     alignment=TA_CENTER,
@@ -378,7 +423,7 @@ class PDFBuilder:
         elements.append(Spacer(1, placeholder_height))
         
         # Placeholder text
-        placeholder_style = ParagraphStyle(
+        placeholder_style = self._style(
             'Placeholder',
             fontName='Helvetica',
             fontSize=FONTS['caption'],
@@ -399,20 +444,9 @@ class PDFBuilder:
         share_url = article.get('share_url', '')
         if share_url:
             try:
-                # Try to generate QR code
-                import qrcode
-                qr = qrcode.QRCode(version=1, box_size=10, border=5)
-                qr.add_data(share_url)
-                qr.make(fit=True)
-                
-                # Create QR image
-                qr_img = qr.make_image(fill_color="black", back_color="white")
-                qr_buffer = BytesIO()
-                qr_img.save(qr_buffer, format='PNG')
-                qr_buffer.seek(0)
-                
-                # Draw QR code
-                canvas_obj.drawImage(qr_buffer, margin, y_position - 80, width=80, height=80)
+                # Draw QR code (rendered once per share URL)
+                qr_image = ImageReader(BytesIO(_qr_png(share_url)))
+                canvas_obj.drawImage(qr_image, margin, y_position - 80, width=80, height=80)
                 
             except ImportError:
                 # Fallback to text
@@ -441,6 +475,51 @@ class PDFBuilder:
         Returns:
             bytes: PDF content as bytes
         """
+        buffer = BytesIO()
+        self.generate_article_pdf_to(article, buffer, page_size)
+        return buffer.getvalue()
+    
+    def generate_article_pdf_to(self, article: Dict, stream: BinaryIO, page_size: str = 'letter') -> None:
+        """
+        Generate PDF for a single article, writing it straight into stream.
+        
+        Args:
+            article (Dict): Article data dictionary
+            stream (BinaryIO): Writable binary file-like object (e.g. an HttpResponse)
+            page_size (str): Page size ('letter' or 'a4')
+        """
+        # Start the image download now so it overlaps with building the text flowables
+        image_url = article.get('image_url')
+        image_future = _IMAGE_EXECUTOR.submit(self._download_image, image_url) if image_url else None
+        self._render_article_pdf(article, stream, page_size, image_future)
+    
+    def generate_articles_pdf(self, articles: List[Dict], page_size: str = 'letter') -> List[bytes]:
+        """
+        Generate one PDF per article, downloading all images concurrently up front.
+        
+        Args:
+            articles (List[Dict]): Article data dictionaries
+            page_size (str): Page size ('letter' or 'a4')
+        
+        Returns:
+            List[bytes]: PDF content for each article, in input order
+        """
+        # Each distinct image URL is fetched once over the pooled session
+        image_futures = {}
+        for article in articles:
+            image_url = article.get('image_url')
+            if image_url and image_url not in image_futures:
+                image_futures[image_url] = _IMAGE_EXECUTOR.submit(self._download_image, image_url)
+        
+        pdfs = []
+        for article in articles:
+            buffer = BytesIO()
+            self._render_article_pdf(article, buffer, page_size, image_futures.get(article.get('image_url')))
+            pdfs.append(buffer.getvalue())
+        return pdfs
+    
+    def _render_article_pdf(self, article: Dict, stream: BinaryIO, page_size: str, image_future: Optional[Future]) -> None:
+        """Lay out and build the PDF into stream, waiting on image_future only for the image flowable."""
         try:
             # Validate page size
             if page_size not in PAGE_SIZES:
@@ -450,12 +529,9 @@ class PDFBuilder:
             page_width, page_height = PAGE_SIZES[page_size]
             margin = 0.75 * inch
             
-            # Create buffer for PDF
-            buffer = BytesIO()
-            
-            # Create PDF document
+            # Create PDF document writing directly to the caller's stream
             doc = SimpleDocTemplate(
-                buffer,
+                stream,
                 pagesize=PAGE_SIZES[page_size],
                 leftMargin=margin,
                 rightMargin=margin,
@@ -470,14 +546,8 @@ class PDFBuilder:
             if not self.fonts_registered:
                 logger.warning("Custom fonts not available, using system fallbacks")
             
-            # Calculate image height first (reserve space at bottom)
-            image_url = article.get('image_url')
-            image_height = 0
-            if image_url:
-                image_data = self._download_image(image_url)
-                if image_data:
-                    img_width = page_width - (2 * margin)
-                    image_height = img_width * 0.75  # Approximate aspect ratio
+            # Reserve space for the image at the bottom
+            image_height = (page_width - (2 * margin)) * 0.75 if image_future else 0  # Approximate aspect ratio
             
             # Build story elements
             story = []
@@ -499,20 +569,17 @@ class PDFBuilder:
             story.extend(tag_elements)
             
             # Image and caption (at bottom)
+            image_data = image_future.result() if image_future else None
+            if isinstance(image_data, BytesIO):
+                image_data.seek(0)  # Downloads may be shared between articles
             image_elements, actual_image_height = self._create_image_and_caption(
-                story, article, language, margin, page_width, page_height
+                story, article, language, margin, page_width, page_height, image_data
             )
             story.extend(image_elements)
             
             # Build PDF
             doc.build(story)
             
-            # Get PDF content
-            pdf_content = buffer.getvalue()
-            buffer.close()
-            
-            return pdf_content
-            
         except Exception as e:
             logger.error(f"PDF generation failed: {e}")
             raise
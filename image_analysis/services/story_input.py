@@ -2,12 +2,16 @@
 Story input service for building story data from media and analysis
 """
 from datetime import datetime, date
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Sequence
 import logging
-from .daypart import get_daypart_from_datetime, get_dayparts_order
+from .daypart import DAYPART_ORDER, get_daypart_from_datetime
 
 logger = logging.getLogger(__name__)
 
+# Shared stand-in for media without analysis; only ever read from
+_EMPTY_ANALYSIS: Dict[str, Any] = {}
+
 def build_story_input(
     media_list: List[Dict[str, Any]], 
     place_ctx: Dict[str, Any], 
@@ -43,25 +47,21 @@ def build_story_input(
             all_dayparts.add(daypart)
             
             # Track earliest date
-            if dt:
-                item_date = dt.date()
-                if earliest_date is None or item_date < earliest_date:
-                    earliest_date = item_date
+            item_date = dt.date() if dt else None
+            if item_date and (earliest_date is None or item_date < earliest_date):
+                earliest_date = item_date
             
             # Build photo data
+            analysis = media_item.get('analysis') or _EMPTY_ANALYSIS
             photo_data = {
                 "media_id": str(media_item.get('id', '')),
                 "daypart": daypart,
                 "local_time": local_time,
-                "img_caption": media_item.get('analysis', {}).get('img_caption', ''),
-                "objects": _filter_low_confidence_items(
-                    media_item.get('analysis', {}).get('detected_objects', [])
-                ),
-                "attributes": _filter_low_confidence_items(
-                    media_item.get('analysis', {}).get('attributes', [])
-                ),
-                "ocr_text": media_item.get('analysis', {}).get('ocr_text', ''),
-                "user_notes": media_item.get('analysis', {}).get('user_notes', ''),
+                "img_caption": analysis.get('img_caption', ''),
+                "objects": _filter_low_confidence_items(analysis.get('detected_objects', ())),
+                "attributes": _filter_low_confidence_items(analysis.get('attributes', ())),
+                "ocr_text": analysis.get('ocr_text', ''),
+                "user_notes": analysis.get('user_notes', ''),
                 "image_url": media_item.get('image_url', ''),
                 "alt_text": media_item.get('alt_text', '')
             }
@@ -69,9 +69,10 @@ def build_story_input(
             photos.append(photo_data)
         
         # Sort photos by daypart order and then by local time
-        dayparts_order = get_dayparts_order(list(all_dayparts))
+        dayparts_order = [dp for dp in DAYPART_ORDER if dp in all_dayparts]
+        daypart_rank = {daypart: rank for rank, daypart in enumerate(dayparts_order)}
         photos.sort(key=lambda x: (
-            dayparts_order.index(x['daypart']) if x['daypart'] in dayparts_order else 999,
+            daypart_rank.get(x['daypart'], 999),
             x['local_time'] if x['local_time'] else '99:99'
         ))
         
@@ -98,6 +99,13 @@ def build_story_input(
         logger.error(f"Error building story input: {e}")
         raise
 
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp (accepting a trailing 'Z'); burst photos share timestamps."""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
 def _get_datetime_from_media(media_item: Dict[str, Any]) -> datetime:
     """
     Extract datetime from media item, preferring EXIF over upload time.
@@ -113,7 +121,7 @@ def _get_datetime_from_media(media_item: Dict[str, Any]) -> datetime:
         exif_datetime = media_item.get('exif_datetime')
         if exif_datetime:
             if isinstance(exif_datetime, str):
-                return datetime.fromisoformat(exif_datetime.replace('Z', '+00:00'))
+                return _parse_iso(exif_datetime)
             elif isinstance(exif_datetime, datetime):
                 return exif_datetime
         
@@ -121,7 +129,7 @@ def _get_datetime_from_media(media_item: Dict[str, Any]) -> datetime:
         uploaded_at = media_item.get('uploaded_at')
         if uploaded_at:
             if isinstance(uploaded_at, str):
-                return datetime.fromisoformat(uploaded_at.replace('Z', '+00:00'))
+                return _parse_iso(uploaded_at)
             elif isinstance(uploaded_at, datetime):
                 return uploaded_at
         
@@ -133,7 +141,7 @@ def _get_datetime_from_media(media_item: Dict[str, Any]) -> datetime:
         logger.error(f"Error parsing datetime for media {media_item.get('id')}: {e}")
         return datetime.utcnow()
 
-def _filter_low_confidence_items(items: List[Dict[str, Any]], threshold: float = 0.8) -> List[Dict[str, Any]]:
+def _filter_low_confidence_items(items: Sequence[Dict[str, Any]], threshold: float = 0.8) -> List[Dict[str, Any]]:
     """
     Filter out low-confidence objects/attributes.
     
@@ -144,20 +152,11 @@ def _filter_low_confidence_items(items: List[Dict[str, Any]], threshold: float =
     Returns:
         Filtered list of items
     """
-    if not items:
-        return []
-    
-    filtered = []
-    for item in items:
-        # If item has confidence field, check threshold
-        if 'confidence' in item:
-            if item.get('confidence', 0.0) >= threshold:
-                filtered.append(item)
-        else:
-            # If no confidence field, include the item
-            filtered.append(item)
-    
-    return filtered
+    # Items without a confidence field (including plain strings) are kept
+    return [
+        item for item in items or ()
+        if not isinstance(item, dict) or item.get('confidence', 1.0) >= threshold
+    ]
 
 def _build_place_string(place_ctx: Dict[str, Any]) -> str:
     """
@@ -169,20 +168,13 @@ def _build_place_string(place_ctx: Dict[str, Any]) -> str:
     Returns:
         Formatted place string
     """
-    parts = []
-    
-    # Add place name if available
-    if place_ctx.get('place_name'):
-        parts.append(place_ctx['place_name'])
-    elif place_ctx.get('city'):
-        parts.append(place_ctx['city'])
-    
-    # Add admin/state if different from city
-    if place_ctx.get('admin') and place_ctx.get('admin') != place_ctx.get('city'):
-        parts.append(place_ctx['admin'])
-    
-    # Add country
-    if place_ctx.get('country'):
-        parts.append(place_ctx['country'])
-    
-    return ", ".join(parts) if parts else ""
+    city = place_ctx.get('city')
+    admin = place_ctx.get('admin')
+
+    # Place name (or city), admin/state if different from city, country
+    parts = (
+        place_ctx.get('place_name') or city,
+        admin if admin != city else None,
+        place_ctx.get('country'),
+    )
+    return ", ".join(part for part in parts if part)
@@ -3,7 +3,9 @@ Writer prompts service for generating day stories using LLM
 """
 import json
 import logging
-from typing import Dict, Any
+import re
+import orjson
+from typing import Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +71,41 @@ MODEL_OUTPUT:
 {MODEL_OUTPUT_JSON}
 """
 
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+def _split_template(template: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Split a prompt template into literal segments and placeholder names.
+    
+    Only {name} placeholders are substituted, so literal braces (like the
+    JSON in OUTPUT_SCHEMA) need no escaping, unlike with str.format.
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+_SPLIT_TEMPLATES = {
+    STORY_GENERATION_PROMPT: _split_template(STORY_GENERATION_PROMPT),
+    STORY_VERIFIER_PROMPT: _split_template(STORY_VERIFIER_PROMPT),
+}
+
+def render_prompt(prompt: str, payload: Dict[str, Any]) -> str:
+    """
+    Fill a prompt template's {name} placeholders from payload.
+    
+    Args:
+        prompt: Prompt template string
+        payload: Dictionary with values for each placeholder
+        
+    Returns:
+        The rendered prompt
+    """
+    segments, keys = _SPLIT_TEMPLATES.get(prompt) or _split_template(prompt)
+    rendered = [segments[0]]
+    for key, segment in zip(keys, segments[1:]):
+        rendered.append(str(payload[key]))
+        rendered.append(segment)
+    return "".join(rendered)
+
 def llm_generate(prompt: str, payload: Dict[str, Any]) -> str:
     """
     Stub function for LLM generation. This will be replaced with actual LLM integration.
@@ -82,16 +119,16 @@ def llm_generate(prompt: str, payload: Dict[str, Any]) -> str:
     """
     try:
         # Format the prompt with payload values
-        formatted_prompt = prompt.format(**payload)
+        formatted_prompt = render_prompt(prompt, payload)
         
         # For now, return a mock response
         # In production, this would call the actual LLM API
         logger.info("LLM generation called with prompt template")
         
         # Mock response for testing
-        if "STORY_GENERATION_PROMPT" in prompt:
+        if prompt is STORY_GENERATION_PROMPT:
             return _generate_mock_story(payload.get('lang', 'en'))
-        elif "STORY_VERIFIER_PROMPT" in prompt:
+        elif prompt is STORY_VERIFIER_PROMPT:
             return _generate_mock_verification(payload.get('MODEL_OUTPUT_JSON', '{}'))
         else:
             return "Mock LLM response"
@@ -111,10 +148,13 @@ def generate_story(story_input: Dict[str, Any]) -> Dict[str, Any]:
         Generated story JSON
     """
     try:
+        # Serialize STORY_INPUT once (compact UTF-8) and reuse it for both passes
+        story_input_json = orjson.dumps(story_input).decode()
+        
         # Step 1: Generate initial story
         gen_payload = {
             "lang": story_input["lang"],
-            "STORY_INPUT_JSON": json.dumps(story_input, ensure_ascii=False, indent=2)
+            "STORY_INPUT_JSON": story_input_json
         }
         
         gen_response = llm_generate(STORY_GENERATION_PROMPT, gen_payload)
@@ -123,7 +163,7 @@ def generate_story(story_input: Dict[str, Any]) -> Dict[str, Any]:
         # Step 2: Verify and correct the story
         verifier_payload = {
             "lang": story_input["lang"],
-            "STORY_INPUT_JSON": json.dumps(story_input, ensure_ascii=False, indent=2),
+            "STORY_INPUT_JSON": story_input_json,
             "MODEL_OUTPUT_JSON": gen_response
         }
         
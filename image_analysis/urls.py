@@ -9,6 +9,10 @@ urlpatterns = [
     # Health check
     path('health/', views.health_check, name='health-check'),
     
+    # Profiling (DEBUG or superuser only)
+    path('_debug/profile/', views.ProfileView.as_view(), name='debug-profile'),
+    path('_debug/profile/result/', views.ProfileResultView.as_view(), name='debug-profile-result'),
+    
     # API endpoints
     path('analyze-image/', views.ImageAnalysisView.as_view(), name='analyze-image'),
     path('regenerate-article/', views.RegenerateArticleView.as_view(), name='regenerate-article'),
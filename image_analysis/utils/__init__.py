@@ -1,9 +1,8 @@
 # Utils package for image_analysis app
 
-from .exif_utils import extract_exif_data, save_image_to_temp, cleanup_temp_file
+from .exif_utils import extract_exif_data, cleanup_temp_file
 
 __all__ = [
     'extract_exif_data',
-    'save_image_to_temp', 
     'cleanup_temp_file',
 ]
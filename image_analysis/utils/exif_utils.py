@@ -2,14 +2,104 @@
 EXIF utility functions for image analysis.
 """
 import os
-import tempfile
+from io import BytesIO
 from PIL import Image
-from PIL.ExifTags import TAGS, GPSTAGS
 from django.conf import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# EXIF tags we actually read, by numeric id; everything else is skipped
+_EXIF_TAGS_OF_INTEREST = {
+    271: 'Make',
+    272: 'Model',
+    274: 'Orientation',
+    306: 'DateTime',
+    36867: 'DateTimeOriginal',
+}
+_GPS_INFO_TAG = 34853
+_EXIF_IFD_TAG = 34665
+
+# Tag ids within the GPS IFD
+_GPS_LAT_REF, _GPS_LAT, _GPS_LON_REF, _GPS_LON = 1, 2, 3, 4
+
+# Only this much of the file is scanned for the EXIF (APP1) segment
+_EXIF_SCAN_LIMIT = 128 * 1024
+
+
+def _read_jpeg_exif_segment(f):
+    """
+    Read the raw EXIF (APP1) segment from a JPEG without opening the image.
+    
+    Walks the marker segments at the start of the file and stops at the
+    first EXIF segment or the start of image data, so only the header is read.
+    
+    Args:
+        f: Binary file object positioned at the start of the image
+    
+    Returns:
+        bytes: The APP1 payload (starting with b'Exif'), or None if the file
+        is not a JPEG or has no EXIF segment in the header
+    """
+    if f.read(2) != b'\xff\xd8':
+        return None
+    while f.tell() < _EXIF_SCAN_LIMIT:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        if marker[1] == 0xFF:
+            # Fill byte before the real marker
+            f.seek(-1, os.SEEK_CUR)
+            continue
+        if marker[1] in (0xD9, 0xDA):
+            # End of image / start of scan: no EXIF in the header
+            return None
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = int.from_bytes(length_bytes, 'big') - 2
+        if marker[1] == 0xE1:
+            payload = f.read(length)
+            if payload.startswith(b'Exif\x00\x00'):
+                return payload
+        else:
+            f.seek(length, os.SEEK_CUR)
+    return None
+
+
+def _load_raw_exif(image):
+    """
+    Load EXIF tags as a flat {tag_id: value} dict plus the GPS IFD.
+    
+    JPEGs are read through their APP1 segment only; other formats fall back
+    to opening the image with PIL.
+    
+    Args:
+        image: Path to the image file, or the image's raw bytes
+    
+    Returns:
+        tuple: (raw_exif, gps_info)
+    """
+    if isinstance(image, (bytes, bytearray)):
+        image = BytesIO(image)
+        segment = _read_jpeg_exif_segment(image)
+        image.seek(0)
+    else:
+        with open(image, 'rb') as f:
+            segment = _read_jpeg_exif_segment(f)
+    
+    if segment is not None:
+        exif = Image.Exif()
+        exif.load(segment)
+    else:
+        with Image.open(image) as img:
+            exif = img.getexif()
+    
+    # Match _getexif(): IFD0 tags with the Exif sub-IFD merged in
+    raw_exif = dict(exif)
+    raw_exif.update(exif.get_ifd(_EXIF_IFD_TAG))
+    return raw_exif, exif.get_ifd(_GPS_INFO_TAG)
+
 
 def convert_gps_to_decimal(gps_lat, gps_lon, lat_ref, lon_ref):
     """
@@ -18,28 +108,21 @@ def convert_gps_to_decimal(gps_lat, gps_lon, lat_ref, lon_ref):
     Args:
         gps_lat: GPS latitude in degrees, minutes, seconds
         gps_lon: GPS longitude in degrees, minutes, seconds
-        lat_ref: Latitude reference ('N' or 'S')
-        lon_ref: Longitude reference ('E' or 'W')
+        lat_ref: Latitude reference ('N' or 'S', str or bytes)
+        lon_ref: Longitude reference ('E' or 'W', str or bytes)
     
     Returns:
         tuple: (decimal_lat, decimal_lon)
     """
     try:
-        # Convert latitude
-        lat_deg = float(gps_lat[0])
-        lat_min = float(gps_lat[1])
-        lat_sec = float(gps_lat[2])
-        decimal_lat = lat_deg + (lat_min / 60.0) + (lat_sec / 3600.0)
-        if lat_ref == 'S':
-            decimal_lat = -decimal_lat
-            
-        # Convert longitude
-        lon_deg = float(gps_lon[0])
-        lon_min = float(gps_lon[1])
-        lon_sec = float(gps_lon[2])
-        decimal_lon = lon_deg + (lon_min / 60.0) + (lon_sec / 3600.0)
-        if lon_ref == 'W':
-            decimal_lon = -decimal_lon
+        # EXIF readers may hand back the reference as str or bytes
+        lat_sign = -1.0 if lat_ref in ('S', b'S') else 1.0
+        lon_sign = -1.0 if lon_ref in ('W', b'W') else 1.0
+        
+        lat_deg, lat_min, lat_sec = gps_lat
+        lon_deg, lon_min, lon_sec = gps_lon
+        decimal_lat = lat_sign * (float(lat_deg) + float(lat_min) / 60.0 + float(lat_sec) / 3600.0)
+        decimal_lon = lon_sign * (float(lon_deg) + float(lon_min) / 60.0 + float(lon_sec) / 3600.0)
             
         return round(decimal_lat, 6), round(decimal_lon, 6)
     except (TypeError, ValueError, IndexError) as e:
@@ -52,78 +135,43 @@ def extract_exif_data(image_path):
     Extract EXIF data from an image file.
     
     Args:
-        image_path: Path to the image file
+        image_path: Path to the image file, or the image's raw bytes
     
     Returns:
         dict: Dictionary containing EXIF data
     """
     try:
-        with Image.open(image_path) as img:
-            exif_data = {}
-            
-            # Extract basic EXIF data
-            if hasattr(img, '_getexif') and img._getexif():
-                exif = img._getexif()
-                for tag_id, value in exif.items():
-                    tag = TAGS.get(tag_id, tag_id)
-                    exif_data[tag] = value
-                
-                # Extract GPS data
-                gps_data = {}
-                if 'GPSInfo' in exif_data:
-                    for gps_tag_id, gps_value in exif_data['GPSInfo'].items():
-                        gps_tag = GPSTAGS.get(gps_tag_id, gps_tag_id)
-                        gps_data[gps_tag] = gps_value
-                    
-                    # Convert GPS coordinates to decimal
-                    if 'GPSLatitude' in gps_data and 'GPSLongitude' in gps_data:
-                        lat_ref = gps_data.get('GPSLatitudeRef', 'N')
-                        lon_ref = gps_data.get('GPSLongitudeRef', 'E')
-                        decimal_lat, decimal_lon = convert_gps_to_decimal(
-                            gps_data['GPSLatitude'],
-                            gps_data['GPSLongitude'],
-                            lat_ref,
-                            lon_ref
-                        )
-                        
-                        if decimal_lat is not None and decimal_lon is not None:
-                            exif_data['gps_decimal'] = {
-                                'lat': decimal_lat,
-                                'lon': decimal_lon
-                            }
-            
-            return exif_data
-            
-    except Exception as e:
-        logger.error(f"Error extracting EXIF data: {e}")
-        return {}
-
-
-def save_image_to_temp(uploaded_file):
-    """
-    Save an uploaded image to a temporary file.
-    
-    Args:
-        uploaded_file: Django UploadedFile object
-    
-    Returns:
-        str: Path to the temporary file
-    """
-    try:
-        # Create a temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.jpg')
-        temp_path = temp_file.name
+        raw_exif, gps_info = _load_raw_exif(image_path)
         
-        # Write the uploaded file content
-        for chunk in uploaded_file.chunks():
-            temp_file.write(chunk)
+        # Extract basic EXIF data (only the tags callers use)
+        exif_data = {
+            name: raw_exif[tag_id]
+            for tag_id, name in _EXIF_TAGS_OF_INTEREST.items()
+            if tag_id in raw_exif
+        }
         
-        temp_file.close()
-        return temp_path
+        # Convert GPS coordinates to decimal
+        gps_lat = gps_info.get(_GPS_LAT)
+        gps_lon = gps_info.get(_GPS_LON)
+        if gps_lat and gps_lon:
+            decimal_lat, decimal_lon = convert_gps_to_decimal(
+                gps_lat,
+                gps_lon,
+                gps_info.get(_GPS_LAT_REF, 'N'),
+                gps_info.get(_GPS_LON_REF, 'E')
+            )
+            
+            if decimal_lat is not None and decimal_lon is not None:
+                exif_data['gps_decimal'] = {
+                    'lat': decimal_lat,
+                    'lon': decimal_lon
+                }
+        
+        return exif_data
         
     except Exception as e:
-        logger.error(f"Error saving image to temp: {e}")
-        return None
+        logger.error(f"Error extracting EXIF data: {e}")
+        return {}
 
 
 def cleanup_temp_file(file_path):
@@ -3,9 +3,17 @@ Markdown to ReportLab Paragraphs converter.
 Supports basic markdown: **bold**, *italic*, and paragraphs.
 """
 import re
+from functools import lru_cache
 from reportlab.platypus import Paragraph
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 
+# Inline markdown patterns, compiled once
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.*?)\*')
+
+# HTML escaping for Paragraph markup in a single pass
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
 
 def convert_markdown_to_paragraphs(markdown_text, style_name='Normal', font_name='Helvetica', font_size=11):
     """
@@ -23,20 +31,8 @@ def convert_markdown_to_paragraphs(markdown_text, style_name='Normal', font_name
     if not markdown_text:
         return []
     
-    # Get base styles
-    styles = getSampleStyleSheet()
-    base_style = styles[style_name]
-    
-    # Create custom style for this font
-    custom_style = ParagraphStyle(
-        f'{style_name}_{font_name}',
-        parent=base_style,
-        fontName=font_name,
-        fontSize=font_size,
-        alignment=4,  # Justified
-        spaceAfter=6,  # 6pt space after paragraphs
-        leading=font_size * 1.35,  # 1.35 line height
-    )
+    # Custom style for this font (built once per combination)
+    custom_style = _build_style(f'{style_name}_{font_name}', style_name, font_name, font_size)
     
     # Split into paragraphs (double newlines)
     paragraphs = markdown_text.split('\n\n')
@@ -62,15 +58,13 @@ def _convert_markdown_inline(text):
     Supports: **bold**, *italic*
     """
     # Escape HTML characters
-    text = text.replace('&', '&amp;')
-    text = text.replace('<', '&lt;')
-    text = text.replace('>', '&gt;')
+    text = text.translate(_HTML_ESCAPE_TABLE)
     
     # Convert **bold** to <b>bold</b>
-    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
+    text = _BOLD_RE.sub(r'<b>\1</b>', text)
     
     # Convert *italic* to <i>italic</i>
-    text = re.sub(r'\*(.*?)\*', r'<i>\1</i>', text)
+    text = _ITALIC_RE.sub(r'<i>\1</i>', text)
     
     # Convert single newlines to <br/>
     text = text.replace('\n', '<br/>')
@@ -89,15 +83,25 @@ def create_tamil_style(base_style_name='Normal', font_size=11):
     Returns:
         ParagraphStyle: Custom style for Tamil text
     """
-    styles = getSampleStyleSheet()
-    base_style = styles[base_style_name]
+    return _build_style(f'{base_style_name}_Tamil', base_style_name, 'NotoSerifTamil', font_size)
+
+
+@lru_cache(maxsize=32)
+def _build_style(name, base_style_name, font_name, font_size):
+    """
+    Build a justified body ParagraphStyle on top of a sample style.
+    
+    Cached so the sample stylesheet and the derived style are only
+    constructed once per combination; callers must not mutate the result.
+    """
+    base_style = getSampleStyleSheet()[base_style_name]
     
     return ParagraphStyle(
-        f'{base_style_name}_Tamil',
+        name,
         parent=base_style,
-        fontName='NotoSerifTamil',  # Tamil font
+        fontName=font_name,
         fontSize=font_size,
         alignment=4,  # Justified
-        spaceAfter=6,
-        leading=font_size * 1.35,
+        spaceAfter=6,  # 6pt space after paragraphs
+        leading=font_size * 1.35,  # 1.35 line height
     )
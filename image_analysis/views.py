@@ -1,6 +1,11 @@
 import logging
 import json
 import os
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -9,7 +14,8 @@ from django.conf import settings
 from django.shortcuts import render
 from django.utils import timezone
 from rest_framework.decorators import api_view
-from django.http import JsonResponse
+from django.http import FileResponse, JsonResponse
+from django.urls import reverse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.views.decorators.http import require_http_methods
@@ -19,14 +25,75 @@ from .serializers import (
     PlaceCandidateSerializer, GeocodeSearchSerializer, GeocodeReverseSerializer,
     LocationUpdateSerializer, StoryPlaceSerializer, LocationResponseSerializer
 )
-from .ai_service import AIService
-from .utils import extract_exif_data, save_image_to_temp, cleanup_temp_file
+from .ai_service import get_ai_service
+from .utils import extract_exif_data, cleanup_temp_file
 from .services.geocode import geocoding_provider
-from .models import StoryPlace, Article
+from .models import StoryPlace, Article, haversine_distance
 import os
 
 logger = logging.getLogger(__name__)
 
+# Article languages the AI service can write (JSON bodies may carry
+# unhashable values, so callers check for str before looking one up)
+SUPPORTED_LANGUAGES = frozenset({'en', 'ta'})
+
+# Static text of the article returned when generation fails, per language
+_FALLBACK_ARTICLES = {
+    'en': {
+        'title': 'Image Analysis Article',
+        'subtitle': 'Article generation unavailable',
+        'body': 'Article generation unavailable for this image.',
+    },
+    'ta': {
+        'title': 'பட பகுப்பாய்வு கட்டுரை',
+        'subtitle': 'கட்டுரை உருவாக்கம் கிடைக்கவில்லை',
+        'body': 'இந்த படத்திற்கான கட்டுரை உருவாக்கம் கிடைக்கவில்லை.',
+    },
+}
+
+# Location regeneration is interactive: bound how long one OpenAI call may
+# hold the request thread, and let the client retry transient failures
+# (rate limits, timeouts, 5xx) with its exponential backoff
+_REGENERATE_TIMEOUT = getattr(settings, 'OPENAI_REGENERATE_TIMEOUT', 60)
+_REGENERATE_MAX_RETRIES = getattr(settings, 'OPENAI_REGENERATE_MAX_RETRIES', 3)
+
+# Prompt for regenerating an article with location context; only the two
+# placeholders change per request
+_REGENERATE_PROMPT = """
+CRITICAL: Create an article based ONLY on the ACTUAL image analysis provided. Do NOT invent fictional content.
+
+Image Analysis (REAL DATA ONLY):
+{original_analysis}
+
+Additional Location Context:
+{location_context}
+
+ARTICLE REQUIREMENTS:
+1. Start with the poetic caption and build upon it artistically
+2. If location is provided, include relevant cultural/historical context
+3. Keep the narrative grounded in the actual image content
+4. Do NOT invent people, places, or events not in the image
+5. Maintain the poetic, artistic tone from the caption
+
+WRITING STYLE:
+- Begin with the poetic description and expand it naturally
+- Use the same artistic, evocative language style
+- Create a flowing narrative that builds from the visual elements
+- Keep it grounded in reality while being artistically expressive
+
+RULES:
+- Base everything on the provided analysis
+- Do NOT invent fictional narratives
+- If analysis is minimal, keep the article brief but poetic
+- Focus on what you can reasonably infer from the visible content
+- Maintain artistic language throughout
+
+Write in first person, but keep it realistic and based on the actual image.
+"""
+
+# EXIF extraction is local file work that can overlap the OpenAI vision call
+_EXIF_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='exif')
+
 
 def index_view(request):
     """
@@ -60,6 +127,132 @@ def health_check(request):
     })
 
 
+def _profiling_forbidden(request):
+    """Return a 403 response unless profiling is allowed for this request."""
+    if settings.DEBUG or request.user.is_superuser:
+        return None
+    return Response(
+        {'error': 'Profiling is only available in DEBUG mode or to superusers'},
+        status=status.HTTP_403_FORBIDDEN
+    )
+
+
+class ProfileView(APIView):
+    """
+    Debug endpoint that records a py-spy flamegraph of the current worker.
+    
+    py-spy samples from a separate process, so the request being profiled is
+    not slowed down the way an in-process profiler would slow it. The worker
+    must be allowed to ptrace itself (e.g. SYS_PTRACE in containers).
+    
+    Only one recording runs per worker at a time; the result is served by
+    ProfileResultView once it has finished.
+    """
+    
+    MAX_DURATION = 300
+    
+    # The worker's latest recording (guarded by _lock)
+    _lock = threading.Lock()
+    _process = None
+    _output_path = None
+    _content_type = None
+    
+    def get(self, request):
+        """Start a py-spy recording in the background and return where to fetch it."""
+        forbidden = _profiling_forbidden(request)
+        if forbidden:
+            return forbidden
+        
+        py_spy = shutil.which('py-spy')
+        if not py_spy:
+            return Response(
+                {'error': 'py-spy is not installed'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        
+        try:
+            duration = int(request.query_params.get('duration', 30))
+        except ValueError:
+            return Response(
+                {'error': 'Invalid input', 'details': {'duration': 'Must be an integer number of seconds'}},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        duration = min(max(duration, 1), self.MAX_DURATION)
+        
+        # speedscope JSON can be opened interactively at speedscope.app
+        output_format = 'speedscope' if request.query_params.get('format') == 'speedscope' else 'flamegraph'
+        extension = 'json' if output_format == 'speedscope' else 'svg'
+        pid = os.getpid()
+        output_path = os.path.join(settings.TEMP_DIR, f"profile-{pid}-{int(time.time())}.{extension}")
+        
+        with ProfileView._lock:
+            if ProfileView._process is not None and ProfileView._process.poll() is None:
+                return Response(
+                    {'error': 'A profile is already being recorded for this worker'},
+                    status=status.HTTP_409_CONFLICT
+                )
+            
+            process = subprocess.Popen(
+                [py_spy, 'record', '--pid', str(pid), '--duration', str(duration),
+                 '--format', output_format, '--output', output_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            # Reap the child when it finishes so it doesn't linger as a zombie
+            threading.Thread(target=process.wait, daemon=True).start()
+            
+            # Drop the previous recording's file; only the latest is served
+            if ProfileView._output_path:
+                cleanup_temp_file(ProfileView._output_path)
+            ProfileView._process = process
+            ProfileView._output_path = output_path
+            ProfileView._content_type = 'application/json' if extension == 'json' else 'image/svg+xml'
+        
+        logger.info(f"Started py-spy profile of pid {pid} for {duration}s -> {output_path}")
+        return Response({
+            'status': 'recording',
+            'pid': pid,
+            'duration': duration,
+            'result_url': request.build_absolute_uri(reverse('debug-profile-result')),
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+class ProfileResultView(APIView):
+    """
+    Debug endpoint serving the latest py-spy recording of the current worker.
+    
+    Requests are routed per worker, so poll from the same worker (e.g. a
+    single-process dev server) that started the recording.
+    """
+    
+    def get(self, request):
+        """Return the recorded flamegraph, or the recording's status."""
+        forbidden = _profiling_forbidden(request)
+        if forbidden:
+            return forbidden
+        
+        with ProfileView._lock:
+            process = ProfileView._process
+            output_path = ProfileView._output_path
+            content_type = ProfileView._content_type
+        
+        if process is None:
+            return Response(
+                {'error': 'No profile has been recorded by this worker'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        if process.poll() is None:
+            return Response({'status': 'recording'}, status=status.HTTP_202_ACCEPTED)
+        if process.returncode != 0 or not os.path.exists(output_path):
+            return Response(
+                {'error': f'py-spy exited with status {process.returncode}'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        return FileResponse(open(output_path, 'rb'), content_type=content_type)
+
+
 class RegenerateArticleView(APIView):
     """
     API view for regenerating articles with additional location context or switching languages.
@@ -109,7 +302,7 @@ class RegenerateArticleView(APIView):
             }
             
             # Initialize AI service and generate article in new language
-            ai_service = AIService()
+            ai_service = get_ai_service()
             
             # Generate article in the target language
             article_data = ai_service.generate_article(
@@ -157,43 +350,20 @@ class RegenerateArticleView(APIView):
                 location_context = f"Coordinates: {coordinates}"
             
             # Initialize AI service and regenerate article
-            ai_service = AIService()
+            ai_service = get_ai_service()
             
             # Create enhanced prompt with location
-            enhanced_prompt = f"""
-            CRITICAL: Create an article based ONLY on the ACTUAL image analysis provided. Do NOT invent fictional content.
-            
-            Image Analysis (REAL DATA ONLY):
-            {original_analysis}
-            
-            Additional Location Context:
-            {location_context}
-            
-            ARTICLE REQUIREMENTS:
-            1. Start with the poetic caption and build upon it artistically
-            2. If location is provided, include relevant cultural/historical context
-            3. Keep the narrative grounded in the actual image content
-            4. Do NOT invent people, places, or events not in the image
-            5. Maintain the poetic, artistic tone from the caption
-            
-            WRITING STYLE:
-            - Begin with the poetic description and expand it naturally
-            - Use the same artistic, evocative language style
-            - Create a flowing narrative that builds from the visual elements
-            - Keep it grounded in reality while being artistically expressive
-            
-            RULES:
-            - Base everything on the provided analysis
-            - Do NOT invent fictional narratives
-            - If analysis is minimal, keep the article brief but poetic
-            - Focus on what you can reasonably infer from the visible content
-            - Maintain artistic language throughout
-            
-            Write in first person, but keep it realistic and based on the actual image.
-            """
+            enhanced_prompt = _REGENERATE_PROMPT.format_map({
+                'original_analysis': original_analysis,
+                'location_context': location_context,
+            })
             
             # Call OpenAI API for enhanced article generation
-            response = ai_service.client.chat.completions.create(
+            client = ai_service.client.with_options(
+                timeout=_REGENERATE_TIMEOUT,
+                max_retries=_REGENERATE_MAX_RETRIES,
+            )
+            response = client.chat.completions.create(
                 model=ai_service.model,
                 messages=[
                     {
@@ -255,113 +425,108 @@ class ImageAnalysisView(APIView):
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
             
+            # Get target language from request (default to English), resolved
+            # before any file I/O
+            target_language = request.data.get('target_language', 'en')
+            if not isinstance(target_language, str) or target_language not in SUPPORTED_LANGUAGES:
+                target_language = 'en'  # Default to English if invalid
+            
             # Get the uploaded image
             image_file = serializer.validated_data['image']
             
-            # Save image to temporary directory
-            temp_image_path = save_image_to_temp(image_file)
+            # Uploads above FILE_UPLOAD_MAX_MEMORY_SIZE are already on disk, so
+            # EXIF extraction and analysis stream from that file in chunks;
+            # smaller uploads are in memory, so their bytes are used directly
+            if hasattr(image_file, 'temporary_file_path'):
+                image_source = image_file.temporary_file_path()
+            else:
+                image_file.seek(0)
+                image_source = image_file.read()
             
+            # Extract EXIF data in the background while the image is analyzed
+            exif_future = _EXIF_EXECUTOR.submit(extract_exif_data, image_source)
             try:
-                # Extract EXIF data
-                exif_data = extract_exif_data(temp_image_path)
-                
-                # Debug: Log what EXIF data was found
-                logger.info(f"EXIF data extracted: {exif_data}")
-                logger.info(f"GPS data: {exif_data.get('gps_decimal')}")
-                logger.info(f"DateTime: {exif_data.get('DateTime')}")
-                logger.info(f"Model: {exif_data.get('Model')}")
-                
                 # Initialize AI service and analyze image
-                ai_service = AIService()
-                ai_results = ai_service.analyze_image(temp_image_path)
-                
-                # Get target language from request (default to English)
-                target_language = request.data.get('target_language', 'en')
-                if target_language not in ['en', 'ta']:
-                    target_language = 'en'  # Default to English if invalid
+                ai_service = get_ai_service()
+                ai_results = ai_service.analyze_image(image_source)
+            finally:
+                exif_data = exif_future.result()
+            
+            # Debug: Log what EXIF data was found (formatted only if DEBUG logging is on)
+            logger.debug("EXIF data extracted: %s", exif_data)
+            logger.debug("GPS data: %s", exif_data.get('gps_decimal'))
+            logger.debug("DateTime: %s", exif_data.get('DateTime'))
+            logger.debug("Model: %s", exif_data.get('Model'))
+            
+            # Generate article from the analysis in the specified language
+            try:
+                article_data = ai_service.generate_article(ai_results, exif_data, target_language)
+                logger.debug("Generated article in %s: %s", target_language, article_data)
                 
-                # Generate article from the analysis in the specified language
+                # Save article to database
                 try:
-                    article_data = ai_service.generate_article(ai_results, exif_data, target_language)
-                    logger.info(f"Generated article in {target_language}: {article_data}")
+                    # The upload isn't persisted anywhere, so there is no image URL yet
+                    # In production, you'd upload to cloud storage and save the real URL
+                    article_id = ai_service.save_article(article_data, ai_results, exif_data, target_language, '')
+                    logger.info(f"Article saved to database with ID: {article_id}")
+                    # Add article ID to response for PDF generation
+                    article_data['article_id'] = article_id
+                except Exception as save_error:
+                    logger.warning(f"Failed to save article to database: {save_error}")
+                    # Continue without saving - article generation was successful
                     
-                    # Save article to database
-                    try:
-                        # Save the actual file path for the uploaded image
-                        # In production, you'd upload to cloud storage and get a real URL
-                        article_id = ai_service.save_article(article_data, ai_results, exif_data, target_language, temp_image_path)
-                        logger.info(f"Article saved to database with ID: {article_id}")
-                        # Add article ID to response for PDF generation
-                        article_data['article_id'] = article_id
-                    except Exception as save_error:
-                        logger.warning(f"Failed to save article to database: {save_error}")
-                        # Continue without saving - article generation was successful
-                        
-                except Exception as e:
-                    logger.warning(f"Article generation failed: {e}")
-                    # Create fallback article structure
-                    if target_language == 'ta':
-                        article_data = {
-                            'title': 'பட பகுப்பாய்வு கட்டுரை',
-                            'subtitle': 'கட்டுரை உருவாக்கம் கிடைக்கவில்லை',
-                            'body': 'இந்த படத்திற்கான கட்டுரை உருவாக்கம் கிடைக்கவில்லை.',
-                            'image_caption': ai_results.get('img_caption', ''),
-                            'alt_text': ai_results.get('img_caption', ''),
-                            'tags': ai_results.get('objects', [])[:5]
-                        }
-                    else:
-                        article_data = {
-                            'title': 'Image Analysis Article',
-                            'subtitle': 'Article generation unavailable',
-                            'body': 'Article generation unavailable for this image.',
-                            'image_caption': ai_results.get('img_caption', ''),
-                            'alt_text': ai_results.get('img_caption', ''),
-                            'tags': ai_results.get('objects', [])[:5]
-                        }
-                
-                # Clean EXIF data to remove null characters and invalid data
-                def clean_exif_value(value):
-                    if value is None:
-                        return None
-                    # Convert to string and remove null characters
-                    cleaned = str(value).replace('\x00', '').strip()
-                    return cleaned if cleaned else None
-                
-                # Prepare response data with new structure
-                response_data = {
-                    'img_caption': ai_results['img_caption'],
-                    'objects': ai_results['objects'],
-                    'ocr_text': ai_results['ocr_text'],
-                    'gps': exif_data.get('gps_decimal'),
-                    'datetime': clean_exif_value(exif_data.get('DateTime')),
-                    'camera_model': clean_exif_value(exif_data.get('Model')),
-                    'article': article_data,  # Now contains the full JSON structure
-                    'target_language': target_language
+            except Exception as e:
+                logger.warning(f"Article generation failed: {e}")
+                # Create fallback article structure
+                caption = ai_results.get('img_caption', '')
+                article_data = {
+                    **_FALLBACK_ARTICLES[target_language],
+                    'image_caption': caption,
+                    'alt_text': caption,
+                    'tags': ai_results.get('objects', [])[:5]
                 }
-                
-                # Log response data for debugging
-                logger.info(f"Response data before validation: {response_data}")
-                
-                # Validate response data
+            
+            # Clean EXIF data to remove null characters and invalid data
+            def clean_exif_value(value):
+                if value is None:
+                    return None
+                # Convert to string and remove null characters
+                cleaned = str(value).replace('\x00', '').strip()
+                return cleaned if cleaned else None
+            
+            # Prepare response data with new structure
+            response_data = {
+                'img_caption': ai_results['img_caption'],
+                'objects': ai_results['objects'],
+                'ocr_text': ai_results['ocr_text'],
+                'gps': exif_data.get('gps_decimal'),
+                'datetime': clean_exif_value(exif_data.get('DateTime')),
+                'camera_model': clean_exif_value(exif_data.get('Model')),
+                'article': article_data,  # Now contains the full JSON structure
+                'target_language': target_language
+            }
+            
+            # Log response data for debugging
+            logger.debug("Response data: %s", response_data)
+            
+            # The response is built in code above, so only re-validate its
+            # shape against the serializer while debugging
+            if settings.DEBUG:
                 response_serializer = ImageAnalysisResponseSerializer(data=response_data)
-                if response_serializer.is_valid():
-                    # Ensure proper content type header
-                    response = Response(response_data, status=status.HTTP_200_OK)
-                    response['Content-Type'] = 'application/json'
-                    logger.info(f"Returning successful response with content type: {response['Content-Type']}")
-                    return response
-                else:
+                if not response_serializer.is_valid():
                     logger.error(f"Response validation failed: {response_serializer.errors}")
                     logger.error(f"Response data that failed validation: {response_data}")
                     return Response(
                         {'error': 'Response validation failed', 'details': response_serializer.errors},
                         status=status.HTTP_500_INTERNAL_SERVER_ERROR
                     )
-                
-            finally:
-                # Clean up temporary file
-                cleanup_temp_file(temp_image_path)
-                
+            
+            # Ensure proper content type header
+            response = Response(response_data, status=status.HTTP_200_OK)
+            response['Content-Type'] = 'application/json'
+            logger.info(f"Returning successful response with content type: {response['Content-Type']}")
+            return response
+            
         except Exception as e:
             logger.error(f"Error processing image analysis request: {e}")
             import traceback
@@ -458,16 +623,6 @@ class StoryLocationView(APIView):
         country = data.get('country', '').strip()
         
         try:
-            # Get or create StoryPlace
-            story_place, created = StoryPlace.objects.get_or_create(
-                story_id=story_id,
-                defaults={
-                    'lat': 0.0,
-                    'lon': 0.0,
-                    'source': 'user_form'
-                }
-            )
-            
             # If only city/country provided, forward geocode to get coordinates
             if not lat and not lon and city and country:
                 candidate = geocoding_provider.forward(city, country)
@@ -476,6 +631,8 @@ class StoryLocationView(APIView):
                     lon = candidate.lon
                     # Update fields with geocoded data
                     data.update({
+                        'lat': lat,
+                        'lon': lon,
                         'place_name': candidate.place_name,
                         'city': candidate.city,
                         'admin': candidate.admin,
@@ -495,7 +652,7 @@ class StoryLocationView(APIView):
                 candidate = geocoding_provider.forward(city, country)
                 if candidate:
                     # Calculate distance between provided coords and geocoded coords
-                    distance = story_place.distance_to(candidate.lat, candidate.lon)
+                    distance = haversine_distance(lat, lon, candidate.lat, candidate.lon)
                     if distance > 20:  # 20km threshold
                         return Response(
                             {'error': 'Location text does not match coordinates, please adjust'},
@@ -523,13 +680,14 @@ class StoryLocationView(APIView):
             else:
                 confidence = 0.7  # Base confidence
             
-            # Update the StoryPlace object
-            for field, value in data.items():
-                if value is not None:
-                    setattr(story_place, field, value)
-            
-            story_place.confidence = confidence
-            story_place.save()
+            # Insert or update the StoryPlace, writing only the fields we have
+            defaults = {field: value for field, value in data.items() if value is not None}
+            defaults['confidence'] = confidence
+            story_place, created = StoryPlace.objects.update_or_create(
+                story_id=story_id,
+                defaults=defaults,
+                create_defaults={'lat': 0.0, 'lon': 0.0, **defaults},
+            )
             
             # Prepare response
             response_data = {
@@ -564,7 +722,7 @@ class SwitchLanguageView(APIView):
             data = request.data
             target_language = data.get('target_language')
             
-            if not target_language or target_language not in ['en', 'ta']:
+            if not isinstance(target_language, str) or target_language not in SUPPORTED_LANGUAGES:
                 return Response(
                     {'error': 'Invalid target language. Must be "en" or "ta"'},
                     status=status.HTTP_400_BAD_REQUEST
@@ -584,7 +742,7 @@ class SwitchLanguageView(APIView):
             }
             
             # Initialize AI service
-            ai_service = AIService()
+            ai_service = get_ai_service()
             
             # Generate article in new language
             article = ai_service.generate_article(
@@ -1,8 +1,15 @@
 """
 PDF Views for generating article PDFs.
 """
+import hashlib
 import logging
-from django.http import HttpResponse, Http404
+import tempfile
+from io import BytesIO
+import orjson
+from django.conf import settings
+from django.core.cache import cache
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils.http import parse_etags
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.views import APIView
@@ -12,10 +19,39 @@ from django.utils.text import slugify
 from urllib.parse import urlparse
 
 from .models import StoryPlace, Article
-from .services.pdf_builder import pdf_builder
+from .services.pdf_builder import PDF_BUILDER_VERSION, pdf_builder
 
 logger = logging.getLogger(__name__)
 
+# PDFs are built into a spooled buffer that moves to disk past this size
+_PDF_SPOOL_MAX_SIZE = 512 * 1024
+
+# Rendered PDFs up to this size are kept in the cache, keyed by their ETag.
+# Only done with a shared backend: a per-process LocMemCache would hold a
+# copy of every PDF in each worker's memory.
+_PDF_CACHE_MAX_SIZE = 256 * 1024
+_PDF_CACHE_TIMEOUT = getattr(settings, 'PDF_CACHE_TIMEOUT', 86400)
+_PDF_CACHE_ENABLED = getattr(settings, 'CACHES', {}).get('default', {}).get(
+    'BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+) not in (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def _pdf_etag(article_data, page_size):
+    """
+    Compute a strong ETag for a rendered PDF.
+    
+    The PDF is a deterministic function of the article data, page size and
+    builder version, so any edit to the article (or to what to_pdf_data()
+    emits) or to the PDF layout changes it.
+    """
+    payload = orjson.dumps(article_data, option=orjson.OPT_SORT_KEYS)
+    digest = hashlib.blake2b(payload, digest_size=16)
+    digest.update(f'{page_size}:{PDF_BUILDER_VERSION}'.encode())
+    return f'"{digest.hexdigest()}"'
+
 
 class ArticlePDFView(APIView):
     """
@@ -65,25 +101,46 @@ class ArticlePDFView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Generate PDF
-            pdf_content = pdf_builder.generate_article_pdf(article_data, page_size)
+            # Unchanged since the client's copy: skip rendering entirely
+            etag = _pdf_etag(article_data, page_size)
+            if_none_match = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+            if etag in if_none_match or '*' in if_none_match:
+                response = HttpResponseNotModified()
+                response['ETag'] = etag
+                return response
+            
+            cache_key = f"pdf:{etag}"
+            cached_pdf = cache.get(cache_key) if _PDF_CACHE_ENABLED else None
+            if cached_pdf is not None:
+                pdf_buffer = BytesIO(cached_pdf)
+            else:
+                # Generate PDF into a spooled buffer and stream it back in blocks
+                pdf_buffer = tempfile.SpooledTemporaryFile(max_size=_PDF_SPOOL_MAX_SIZE)
+                try:
+                    pdf_builder.generate_article_pdf_to(article_data, pdf_buffer, page_size)
+                    if _PDF_CACHE_ENABLED and pdf_buffer.tell() <= _PDF_CACHE_MAX_SIZE:
+                        pdf_buffer.seek(0)
+                        cache.set(cache_key, pdf_buffer.read(), _PDF_CACHE_TIMEOUT)
+                except Exception:
+                    pdf_buffer.close()
+                    raise
+                pdf_buffer.seek(0)
             
             # Create filename
             title = article_data.get('title', 'Untitled')
             filename = f"{slugify(title)}.pdf"
             
-            # Create response
-            response = HttpResponse(pdf_content, content_type='application/pdf')
+            # Create response (closes the buffer once it has been sent)
+            response = FileResponse(pdf_buffer, content_type='application/pdf')
             
             if inline:
                 response['Content-Disposition'] = f'inline; filename="{filename}"'
             else:
                 response['Content-Disposition'] = f'attachment; filename="{filename}"'
             
-            # Set cache headers
-            response['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-            response['Pragma'] = 'no-cache'
-            response['Expires'] = '0'
+            # Set cache headers: clients keep a private copy but revalidate it
+            response['Cache-Control'] = 'private, max-age=0, must-revalidate'
+            response['ETag'] = etag
             
             return response
             
@@ -100,14 +157,14 @@ class ArticlePDFView(APIView):
         """
         try:
             # Try to fetch article by article_id first
-            article = Article.objects.filter(article_id=story_id).first()
+            article = Article.objects.only(*Article.PDF_FIELDS).filter(article_id=story_id).first()
             
             if article:
                 # Convert to PDF format
                 return article.to_pdf_data()
             
-            # If not found by article_id, try to find by title (for backward compatibility)
-            article = Article.objects.filter(title__icontains=story_id).first()
+            # If not found by article_id, try an exact (indexed) title match (for backward compatibility)
+            article = Article.objects.only(*Article.PDF_FIELDS).filter(title=story_id).first()
             
             if article:
                 return article.to_pdf_data()
@@ -131,14 +188,14 @@ class ArticlePDFViewTamil(ArticlePDFView):
         """
         try:
             # Try to fetch Tamil article by article_id first
-            article = Article.objects.filter(article_id=story_id, language='ta').first()
+            article = Article.objects.only(*Article.PDF_FIELDS).filter(article_id=story_id, language='ta').first()
             
             if article:
                 # Convert to PDF format
                 return article.to_pdf_data()
             
-            # If not found by article_id, try to find by title (for backward compatibility)
-            article = Article.objects.filter(title__icontains=story_id, language='ta').first()
+            # If not found by article_id, try an exact (indexed) title match (for backward compatibility)
+            article = Article.objects.only(*Article.PDF_FIELDS).filter(title=story_id, language='ta').first()
             
             if article:
                 return article.to_pdf_data()
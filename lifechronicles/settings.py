@@ -113,6 +113,9 @@ TEMP_DIR = '/tmp'
 OPENAI_API_KEY = config('OPENAI_API_KEY', default='')
 OPENAI_MODEL = 'gpt-4o'
 
+# Maximum number of concurrent OpenAI requests for bulk operations
+AI_MAX_CONCURRENCY = config('AI_MAX_CONCURRENCY', default=8, cast=int)
+
 # Validate OpenAI configuration
 if not OPENAI_API_KEY:
     print("WARNING: OPENAI_API_KEY is not set!")